@@ -11,10 +11,11 @@ from dataclasses import asdict
 from datetime import datetime, timezone
 from pathlib import Path
 
-from bs4 import BeautifulSoup
-
+import utils_seo
+import utils_seo_selectolax
 from models_seo import Issue, PageSEOReport
 from utils_files import get_website_id
+from utils_html import parse_html
 from utils_links import (
     extract_images,
     extract_links,
@@ -22,23 +23,6 @@ from utils_links import (
     verify_external_links,
 )
 from utils_requests import get_session
-from utils_seo import (
-    extract_canonical,
-    extract_faq_sections,
-    extract_h1,
-    extract_headings,
-    extract_hreflang,
-    extract_keywords,
-    extract_localization,
-    extract_meta_description,
-    extract_open_graph,
-    extract_robots_meta,
-    extract_scripts,
-    extract_structured_data,
-    extract_title,
-    extract_twitter_card,
-    extract_viewport,
-)
 
 # ──────────────────────────────────────────────
 # CONFIGURATION - edit these values before running
@@ -387,7 +371,17 @@ async def main() -> None:
     # Step 1: Load and parse HTML
     print("── Loading HTML ──")
     html_content = file_path.read_text(encoding="utf-8")
-    soup = BeautifulSoup(html_content, "lxml")
+    soup = parse_html(html_content)
+
+    # Head, heading, JSON-LD, script, FAQ and keyword checks run on a Lexbor
+    # tree when selectolax is installed (same results, far cheaper than bs4
+    # searches); the soup is still used for links and images.
+    if utils_seo_selectolax.SELECTOLAX_AVAILABLE:
+        seo = utils_seo_selectolax
+        tree = utils_seo_selectolax.parse_html(html_content)
+    else:
+        seo = utils_seo
+        tree = soup
     print(f"  Parsed {len(html_content):,} bytes")
 
     # Step 2: Derive page URL from file path
@@ -398,51 +392,48 @@ async def main() -> None:
     print()
     print("── Running SEO checks ──")
 
-    title = extract_title(soup)
+    title = seo.extract_title(tree)
     print(f"  [OK] Title")
 
-    meta_description = extract_meta_description(soup)
-    print(f"  [OK] Meta description")
+    meta_tags = seo.extract_all_meta(tree)
+    meta_description = meta_tags.description
+    robots = meta_tags.robots
+    open_graph = meta_tags.open_graph
+    twitter_card = meta_tags.twitter_card
+    viewport = meta_tags.viewport
+    print(f"  [OK] Meta tags (description, robots, viewport, Open Graph, Twitter Card)")
 
-    canonical = extract_canonical(soup, page_url)
+    canonical = seo.extract_canonical(tree, page_url)
     print(f"  [OK] Canonical")
 
-    robots = extract_robots_meta(soup)
-    print(f"  [OK] Robots meta")
-
-    h1 = extract_h1(soup)
+    h1, headings = seo.extract_heading_outline(tree)
     print(f"  [OK] H1")
-
-    headings = extract_headings(soup)
     print(f"  [OK] Headings hierarchy ({len(headings.headings)} headings)")
 
-    open_graph = extract_open_graph(soup)
-    print(f"  [OK] Open Graph")
-
-    twitter_card = extract_twitter_card(soup)
-    print(f"  [OK] Twitter Card")
-
-    structured_data = extract_structured_data(soup)
+    # Scripts and JSON-LD come from one script search
+    scripts, structured_data = seo.extract_script_outline(tree)
     print(f"  [OK] Structured data ({len(structured_data)} schemas)")
+    print(f"  [OK] Scripts ({len(scripts)} scripts)")
 
-    viewport = extract_viewport(soup)
-    print(f"  [OK] Viewport")
-
-    hreflangs = extract_hreflang(soup)
+    hreflangs = seo.extract_hreflang(tree)
     print(f"  [OK] Hreflang ({len(hreflangs)} tags)")
 
-    localization = extract_localization(soup)
+    localization = seo.extract_localization(tree)
     print(f"  [OK] Localization")
 
-    scripts = extract_scripts(soup)
-    print(f"  [OK] Scripts ({len(scripts)} scripts)")
-
-    faqs = extract_faq_sections(soup)
+    faqs = seo.extract_faq_sections(tree, structured_data)
     print(f"  [OK] FAQ sections ({len(faqs)} FAQs)")
 
-    keywords = extract_keywords(soup)
+    keywords = seo.extract_keywords(tree)
     print(f"  [OK] Keywords ({keywords.total_words} words)")
 
+    # utils_seo.extract_keywords strips <noscript> from the body of the soup;
+    # do the same when keywords ran on Lexbor, so the link and image reports
+    # match either way (head <noscript> pixels stay in both)
+    if tree is not soup:
+        for tag in (soup.body or soup).find_all("noscript"):
+            tag.decompose()
+
     # Step 4: Process links
     print()
     print("── Processing links ──")
@@ -23,7 +23,7 @@ from utils_wayback import (
     FrequencyType,
     WaybackSnapshot,
     fetch_cdx_snapshots,
-    fetch_snapshot_html,
+    fetch_snapshots_html,
     filter_snapshots_by_frequency,
 )
 
@@ -51,7 +51,6 @@ RESET = "\033[0m"
 
 async def download_snapshots_batch(
     client: httpx.AsyncClient,
-    semaphore: asyncio.Semaphore,
     snapshots: list[WaybackSnapshot],
     base_dir: Path,
     stats: Counter,
@@ -60,18 +59,11 @@ async def download_snapshots_batch(
 
     Args:
         client: The httpx async client.
-        semaphore: Concurrency limiter.
         snapshots: List of snapshots to download.
         base_dir: Output directory for saved HTML files.
         stats: Counter for tracking download statistics.
     """
-
-    async def fetch_one(snapshot: WaybackSnapshot) -> tuple[WaybackSnapshot, str | None, str | None]:
-        async with semaphore:
-            return await fetch_snapshot_html(snapshot, client)
-
-    tasks = [fetch_one(s) for s in snapshots]
-    results = await asyncio.gather(*tasks)
+    results = await fetch_snapshots_html(snapshots, client, concurrency=PARALLELISM)
 
     for snapshot, html, error in results:
         if error:
@@ -165,10 +157,10 @@ async def main() -> None:
     print("── Downloading snapshots ──")
 
     stats: Counter = Counter()
-    semaphore = asyncio.Semaphore(PARALLELISM)
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        await download_snapshots_batch(client, semaphore, to_download, base_dir, stats)
+    limits = httpx.Limits(max_connections=PARALLELISM, max_keepalive_connections=PARALLELISM)
+    async with httpx.AsyncClient(timeout=60.0, limits=limits) as client:
+        await download_snapshots_batch(client, to_download, base_dir, stats)
 
     # ── Step 6: Print statistics ──
     print()
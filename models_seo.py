@@ -4,6 +4,7 @@ Dataclasses for SEO page checker JSON response.
 All classes are designed to be JSON-serializable via dataclasses.asdict().
 """
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -23,7 +24,7 @@ class TitleInfo:
 
     text: str | None
     length: int
-    issues: list[str] = field(default_factory=list)
+    issues: Sequence[str] = ()
 
 
 @dataclass
@@ -32,7 +33,7 @@ class MetaInfo:
 
     text: str | None
     length: int
-    issues: list[str] = field(default_factory=list)
+    issues: Sequence[str] = ()
 
 
 @dataclass
@@ -41,7 +42,7 @@ class CanonicalInfo:
 
     url: str | None
     is_self: bool
-    issues: list[str] = field(default_factory=list)
+    issues: Sequence[str] = ()
 
 
 @dataclass
@@ -51,7 +52,7 @@ class RobotsInfo:
     meta_robots: str | None
     x_robots_tag: str | None
     indexable: bool
-    issues: list[str] = field(default_factory=list)
+    issues: Sequence[str] = ()
 
 
 @dataclass
@@ -60,10 +61,10 @@ class HeadingInfo:
 
     text: str | None
     count: int
-    issues: list[str] = field(default_factory=list)
+    issues: Sequence[str] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class HeadingItem:
     """A single heading in the document hierarchy."""
 
@@ -77,10 +78,10 @@ class HeadingsHierarchy:
     """Information about the heading structure of the page."""
 
     headings: list[HeadingItem] = field(default_factory=list)
-    issues: list[str] = field(default_factory=list)
+    issues: Sequence[str] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class LinkInfo:
     """Information about a link on the page."""
 
@@ -92,7 +93,7 @@ class LinkInfo:
     content_type: str = "text"  # text, image, logo, icon, button, svg, mixed, empty
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageInfo:
     """Information about an image on the page."""
 
@@ -102,7 +103,7 @@ class ImageInfo:
     format: str | None = None
     width: int | None = None
     height: int | None = None
-    issues: list[str] = field(default_factory=list)
+    issues: Sequence[str] = ()
 
 
 @dataclass
@@ -143,7 +144,7 @@ class ViewportInfo:
 
     content: str | None = None
     is_mobile_friendly: bool = False
-    issues: list[str] = field(default_factory=list)
+    issues: Sequence[str] = ()
 
 
 @dataclass
@@ -162,7 +163,7 @@ class LocalizationInfo:
     content_language: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ScriptInfo:
     """Information about a script on the page."""
 
@@ -173,7 +174,7 @@ class ScriptInfo:
     has_defer: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class FAQInfo:
     """FAQ item information."""
 
@@ -198,6 +199,61 @@ class KeywordsInfo:
     total_words: int = 0
 
 
+@dataclass
+class MetaTagsInfo:
+    """Meta tag information collected in a single pass over <meta> tags."""
+
+    description: MetaInfo
+    robots: RobotsInfo
+    open_graph: OpenGraphInfo
+    twitter_card: TwitterCardInfo
+    viewport: ViewportInfo
+
+
+@dataclass
+class DocumentSEOInfo:
+    """Head, heading and JSON-LD elements collected in a single DOM walk."""
+
+    title: TitleInfo
+    meta_description: MetaInfo
+    canonical: CanonicalInfo
+    robots: RobotsInfo
+    h1: HeadingInfo
+    headings_hierarchy: HeadingsHierarchy
+    open_graph: OpenGraphInfo
+    twitter_card: TwitterCardInfo
+    schemas: list[SchemaInfo]
+    viewport: ViewportInfo
+    hreflangs: list[HreflangInfo]
+    localization: LocalizationInfo
+
+
+@dataclass
+class PageSEOData:
+    """
+    Page-level SEO elements extracted from one HTML document.
+
+    Field names match PageSEOReport. Links and images are not included, since
+    they need the site URL and network checks.
+    """
+
+    title: TitleInfo
+    meta_description: MetaInfo
+    canonical: CanonicalInfo
+    robots: RobotsInfo
+    h1: HeadingInfo
+    headings_hierarchy: HeadingsHierarchy
+    open_graph: OpenGraphInfo
+    twitter_card: TwitterCardInfo
+    schemas: list[SchemaInfo]
+    viewport: ViewportInfo
+    hreflangs: list[HreflangInfo]
+    localization: LocalizationInfo
+    scripts: list[ScriptInfo]
+    faqs: list[FAQInfo]
+    keywords: KeywordsInfo
+
+
 @dataclass
 class PageSEOReport:
     """
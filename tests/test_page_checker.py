@@ -0,0 +1,61 @@
+"""End-to-end tests for 3-page-checker.py: the report must not depend on selectolax."""
+
+import asyncio
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+import utils_seo_selectolax
+
+CHECKER_PATH = Path(__file__).resolve().parent.parent / "3-page-checker.py"
+
+NOSCRIPT_HTML = """<!DOCTYPE html>
+<html lang="en"><head>
+<title>Noscript pixels and fallbacks on one page</title>
+<noscript><img height="1" width="1" src="https://www.facebook.com/tr?id=1&amp;ev=PageView"></noscript>
+</head><body>
+<h1>Noscript page</h1>
+<p>Body text with a <a href="/about">link</a>.</p>
+<noscript><a href="/no-js">No JS</a><img src="/img/fallback.png" alt="Fallback"></noscript>
+<img src="/img/hero.jpg" alt="Hero">
+</body></html>
+"""
+
+
+def _run_checker(monkeypatch: pytest.MonkeyPatch, tmp_path: Path, use_lexbor: bool) -> dict:
+    """Run the page checker on NOSCRIPT_HTML and return its JSON report."""
+    spec = importlib.util.spec_from_file_location("page_checker", CHECKER_PATH)
+    checker = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(checker)
+
+    page = tmp_path / "scraped" / "example_com" / "200-page.html"
+    page.parent.mkdir(parents=True, exist_ok=True)
+    page.write_text(NOSCRIPT_HTML, encoding="utf-8")
+
+    monkeypatch.setattr(checker, "HTML_FILE_PATH", str(page))
+    monkeypatch.setattr(checker, "WEBSITE_URL", "https://example.com")
+    monkeypatch.setattr(checker, "SCRAPED_DIR", tmp_path / "scraped")
+    monkeypatch.setattr(utils_seo_selectolax, "SELECTOLAX_AVAILABLE", use_lexbor)
+    asyncio.run(checker.main())
+
+    report = json.loads(page.with_name("200-page_seo_report.json").read_text(encoding="utf-8"))
+    report.pop("analyzed_at")
+    return report
+
+
+def test_report_is_the_same_with_and_without_selectolax(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    pytest.importorskip("selectolax")
+    bs4_report = _run_checker(monkeypatch, tmp_path, use_lexbor=False)
+    lexbor_report = _run_checker(monkeypatch, tmp_path, use_lexbor=True)
+
+    assert lexbor_report == bs4_report
+    # Head <noscript> pixels are kept; body <noscript> fallbacks are dropped
+    assert [image["src"] for image in bs4_report["images"]] == [
+        "https://www.facebook.com/tr?id=1&ev=PageView",
+        "https://example.com/img/hero.jpg",
+    ]
+    assert [link["href"] for link in bs4_report["links"]] == ["https://example.com/about"]
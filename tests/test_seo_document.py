@@ -0,0 +1,58 @@
+"""Parity tests: extract_document_seo must match the per-element bs4 extractors."""
+
+import pytest
+from lxml import html as lxml_html
+
+import utils_seo
+from utils_html import parse_html
+
+PAGE_URL = "https://example.com/page"
+
+EMPTY_TITLE_HTML = """
+<html><head><title></title></head>
+<body><svg><title>Icon</title></svg><h1>Heading</h1></body></html>
+"""
+
+HIDDEN_TEXT_HTML = """
+<html><head><title>Hidden text page</title></head><body>
+<h1>One<script>var x=1</script><style>a{}</style><template>T<b>tb</b></template>
+<ruby>漢<rp>(</rp><rt>k<b>an</b></rt><rp>)</rp></ruby><!--c-->Two</h1>
+<template><h2>Inside template</h2></template>
+<h3> Plain <i>x</i></h3>
+</body></html>
+"""
+
+
+def _expected(html: str) -> dict:
+    soup = parse_html(html)
+    meta = utils_seo.extract_all_meta(soup)
+    h1, headings = utils_seo.extract_heading_outline(soup)
+    return {
+        "title": utils_seo.extract_title(soup),
+        "meta_description": meta.description,
+        "canonical": utils_seo.extract_canonical(soup, PAGE_URL),
+        "robots": meta.robots,
+        "h1": h1,
+        "headings_hierarchy": headings,
+        "open_graph": meta.open_graph,
+        "twitter_card": meta.twitter_card,
+        "schemas": utils_seo.extract_structured_data(soup),
+        "viewport": utils_seo.extract_viewport(soup),
+        "hreflangs": utils_seo.extract_hreflang(soup),
+        "localization": utils_seo.extract_localization(soup),
+    }
+
+
+@pytest.mark.parametrize("html", [EMPTY_TITLE_HTML, HIDDEN_TEXT_HTML])
+def test_document_seo_parity(html: str) -> None:
+    info = utils_seo.extract_document_seo(lxml_html.document_fromstring(html), PAGE_URL)
+    for name, expected in _expected(html).items():
+        assert getattr(info, name) == expected, name
+
+
+def test_empty_first_title_is_not_replaced_by_svg_title() -> None:
+    info = utils_seo.extract_document_seo(
+        lxml_html.document_fromstring(EMPTY_TITLE_HTML), PAGE_URL
+    )
+    assert info.title.text is None
+    assert info.title.issues == ["Missing title tag"]
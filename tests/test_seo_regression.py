@@ -0,0 +1,285 @@
+"""Regression tests: every extraction path must reproduce the pre-optimization output.
+
+The expected values were produced by the original bs4 extractors (before the
+extraction performance work) on PAGE_HTML, which is parsed the same way by every
+path. Behaviour that was changed on purpose (path-case canonicals, decimal image
+dimensions, ...) is left out of the fixture.
+"""
+
+import dataclasses
+import json
+
+import pytest
+from lxml import html as lxml_html
+
+import utils_seo
+from utils_html import parse_html
+from utils_links import extract_images, extract_links
+
+PAGE_URL = "https://example.com/widgets/"
+SITE_URL = "https://example.com"
+
+PAGE_HTML = """<!DOCTYPE html>
+<html lang="en-US"><head>
+<meta charset="utf-8">
+<title>Acme Widgets - Durable Steel Widgets for Every Workshop</title>
+<meta name="description" content="Acme builds durable steel widgets for workshops, factories and hobbyists. Browse sizes, finishes and bulk pricing, then order online with free shipping.">
+<meta name="robots" content="index, follow">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<link rel="canonical" href="https://example.com/widgets/">
+<link rel="alternate" hreflang="de" href="https://example.com/de/widgets/">
+<meta property="og:title" content="Acme Widgets">
+<meta name="twitter:card" content="summary">
+<script type="application/ld+json">
+{"@context": "https://schema.org", "@type": "FAQPage", "mainEntity": [
+ {"@type": "Question", "name": "Are the widgets rust proof?",
+  "acceptedAnswer": {"@type": "Answer", "text": "Yes, every widget is galvanized."}}]}
+</script>
+<script src="/static/app.js" defer></script>
+</head><body>
+<header><a href="/" class="logo"><img src="/img/logo.svg" alt="Acme logo"></a>
+<nav><a href="/widgets/">Widgets</a> <a href="/about">About us</a>
+<a href="https://partner.example.org/shop" rel="nofollow">Partner shop</a>
+<a href="/cart" class="btn btn-primary">Cart</a><a href="/search"><i class="fa fa-search"></i></a></nav></header>
+<h1>Durable <em>steel</em> widgets</h1>
+<h2>Sizes</h2><h4>Small widgets</h4><h3>Large widgets</h3>
+<p>Steel widgets come in small and large sizes. Every steel widget is galvanized steel.</p>
+<img src="/img/widget-small.jpg" alt="Small steel widget" width="300" height="200" loading="lazy">
+<img src="/img/widget-large.webp" width="600px">
+<noscript><a href="/noscript-link">No JS</a><img src="/img/pixel.gif"></noscript>
+<details><summary>Do you ship abroad?</summary><p>We ship to the EU and UK.</p></details>
+<dl><dt>What finishes exist?</dt><dd>Matte and polished.</dd></dl>
+<div class="faq-section"><h3>Can I order in bulk?</h3><p>Yes, bulk pricing starts at 100 widgets.</p></div>
+<a href="mailto:sales@example.com">Email sales</a> <a href="#top"></a>
+<script>var widgets = "steel steel steel";</script><style>.steel{}</style>
+</body></html>
+"""
+
+EXPECTED = {
+    "title": {
+        "text": "Acme Widgets - Durable Steel Widgets for Every Workshop",
+        "length": 55,
+        "issues": [],
+    },
+    "meta_description": {
+        "text": (
+            "Acme builds durable steel widgets for workshops, factories and hobbyists. "
+            "Browse sizes, finishes and bulk pricing, then order online with free shipping."
+        ),
+        "length": 152,
+        "issues": [],
+    },
+    "canonical": {"url": "https://example.com/widgets/", "is_self": True, "issues": []},
+    "robots": {
+        "meta_robots": "index, follow",
+        "x_robots_tag": None,
+        "indexable": True,
+        "issues": [],
+    },
+    "h1": {"count": 1, "text": "Durablesteelwidgets", "issues": []},
+    "headings_hierarchy": {
+        "headings": [
+            {"tag": "h1", "text": "Durablesteelwidgets", "level": 1},
+            {"tag": "h2", "text": "Sizes", "level": 2},
+            {"tag": "h4", "text": "Small widgets", "level": 4},
+            {"tag": "h3", "text": "Large widgets", "level": 3},
+            {"tag": "h3", "text": "Can I order in bulk?", "level": 3},
+        ],
+        "issues": ["Heading hierarchy skip: h2 -> h4 (missing h3)"],
+    },
+    "faqs": [
+        {
+            "question": "Are the widgets rust proof?",
+            "answer": "Yes, every widget is galvanized.",
+            "has_schema": True,
+        },
+        {"question": "Do you ship abroad?", "answer": "We ship to the EU and UK.", "has_schema": False},
+        {"question": "What finishes exist?", "answer": "Matte and polished.", "has_schema": False},
+        {
+            "question": "Can I order in bulk?",
+            "answer": "Yes, bulk pricing starts at 100 widgets.",
+            "has_schema": False,
+        },
+    ],
+    "keywords": {
+        "top_terms": [
+            {"term": term, "count": count}
+            for term, count in [
+                ("widgets", 6), ("steel", 4), ("sizes", 2), ("small", 2), ("large", 2),
+                ("ship", 2), ("bulk", 2), ("partner", 1), ("shop", 1), ("cart", 1),
+                ("durable", 1), ("come", 1), ("every", 1), ("widget", 1), ("galvanized", 1),
+                ("abroad", 1), ("eu", 1), ("uk", 1), ("finishes", 1), ("exist", 1),
+            ]
+        ],
+        "total_words": 59,
+    },
+}
+
+# Links and images as the page checker sees them: extracted after keywords,
+# so <noscript> content is gone
+EXPECTED_LINKS = [
+    [
+        {"href": "https://example.com/", "anchor": "", "content_type": "logo", "rel": []},
+        {"href": "https://example.com/widgets/", "anchor": "Widgets", "content_type": "text", "rel": []},
+        {"href": "https://example.com/about", "anchor": "About us", "content_type": "text", "rel": []},
+        {"href": "https://example.com/cart", "anchor": "Cart", "content_type": "button", "rel": []},
+        {"href": "https://example.com/search", "anchor": "", "content_type": "icon", "rel": []},
+    ],
+    [
+        {
+            "href": "https://partner.example.org/shop",
+            "anchor": "Partner shop",
+            "content_type": "text",
+            "rel": ["nofollow"],
+        },
+    ],
+]
+
+EXPECTED_IMAGES = [
+    {
+        "src": "https://example.com/img/logo.svg",
+        "alt": "Acme logo",
+        "width": None,
+        "height": None,
+        "format": "svg",
+        "has_lazy": False,
+        "issues": [],
+    },
+    {
+        "src": "https://example.com/img/widget-small.jpg",
+        "alt": "Small steel widget",
+        "width": 300,
+        "height": 200,
+        "format": "jpg",
+        "has_lazy": True,
+        "issues": [],
+    },
+    {
+        "src": "https://example.com/img/widget-large.webp",
+        "alt": None,
+        "width": 600,
+        "height": None,
+        "format": "webp",
+        "has_lazy": False,
+        "issues": ["Missing alt text"],
+    },
+]
+
+# JSON-LD the original json.loads decoded but orjson rejects (NaN)
+NAN_LD_JSON_HTML = """<html><head>
+<script type="application/ld+json">
+{"@context": "https://schema.org", "@type": "FAQPage", "mainEntity": [
+ {"@type": "Question", "name": "Is the widget waterproof?", "upvoteCount": NaN,
+  "acceptedAnswer": {"@type": "Answer", "text": "Yes, up to 10 m."}}]}
+</script>
+</head><body><h1>Waterproof widgets</h1></body></html>
+"""
+
+DOCUMENT_FIELDS = ["title", "meta_description", "canonical", "robots", "h1", "headings_hierarchy"]
+
+
+def _plain(value: object) -> object:
+    """Convert extractor results to their JSON report form (tuples become lists)."""
+
+    def default(obj: object) -> object:
+        if dataclasses.is_dataclass(obj):
+            return dataclasses.asdict(obj)
+        return list(obj)
+
+    return json.loads(json.dumps(value, default=default))
+
+
+def _checker_report(seo, tree) -> dict:
+    """Run the extractors in the page checker's order (keywords last)."""
+    meta = seo.extract_all_meta(tree)
+    h1, headings = seo.extract_heading_outline(tree)
+    _, schemas = seo.extract_script_outline(tree)
+    return {
+        "title": seo.extract_title(tree),
+        "meta_description": meta.description,
+        "canonical": seo.extract_canonical(tree, PAGE_URL),
+        "robots": meta.robots,
+        "h1": h1,
+        "headings_hierarchy": headings,
+        "faqs": seo.extract_faq_sections(tree, schemas),
+        "keywords": seo.extract_keywords(tree),
+    }
+
+
+def _single_extractor_report(seo, tree) -> dict:
+    """Run the standalone extractors, each on its own."""
+    return {
+        "title": seo.extract_title(tree),
+        "meta_description": seo.extract_meta_description(tree),
+        "canonical": seo.extract_canonical(tree, PAGE_URL),
+        "robots": seo.extract_robots_meta(tree),
+        "h1": seo.extract_h1(tree),
+        "headings_hierarchy": seo.extract_headings(tree),
+        "faqs": seo.extract_faq_sections(tree),
+        "keywords": seo.extract_keywords(tree),
+    }
+
+
+@pytest.mark.parametrize("build_report", [_checker_report, _single_extractor_report])
+def test_bs4_matches_original_output(build_report) -> None:
+    assert _plain(build_report(utils_seo, parse_html(PAGE_HTML))) == EXPECTED
+
+
+@pytest.mark.parametrize("build_report", [_checker_report, _single_extractor_report])
+def test_lexbor_matches_original_output(build_report) -> None:
+    utils_seo_selectolax = pytest.importorskip("utils_seo_selectolax")
+    if not utils_seo_selectolax.SELECTOLAX_AVAILABLE:
+        pytest.skip("selectolax is not installed")
+    tree = utils_seo_selectolax.parse_html(PAGE_HTML)
+    assert _plain(build_report(utils_seo_selectolax, tree)) == EXPECTED
+
+
+def test_page_seo_matches_original_output() -> None:
+    info = utils_seo.extract_page_seo(PAGE_HTML, PAGE_URL)
+    assert _plain({name: getattr(info, name) for name in EXPECTED}) == EXPECTED
+
+
+def test_document_seo_matches_original_output() -> None:
+    info = utils_seo.extract_document_seo(lxml_html.document_fromstring(PAGE_HTML), PAGE_URL)
+    actual = {name: getattr(info, name) for name in DOCUMENT_FIELDS}
+    assert _plain(actual) == {name: EXPECTED[name] for name in DOCUMENT_FIELDS}
+
+
+def test_links_and_images_match_original_output() -> None:
+    soup = parse_html(PAGE_HTML)
+    utils_seo.extract_keywords(soup)
+
+    internal, external = extract_links(soup, PAGE_URL, SITE_URL)
+    links = [
+        [{key: link[key] for key in ("href", "anchor", "content_type", "rel")} for link in group]
+        for group in _plain([internal, external])
+    ]
+    assert links == EXPECTED_LINKS
+    assert [link.is_internal for link in internal + external] == [True] * 5 + [False]
+    assert _plain(extract_images(soup, PAGE_URL)) == EXPECTED_IMAGES
+
+
+def test_json_ld_with_nan_matches_original_output(monkeypatch: pytest.MonkeyPatch) -> None:
+    def decode(seo, tree) -> str:
+        # repr, since NaN never compares equal to itself
+        return repr((seo.extract_structured_data(tree), seo.extract_faq_sections(tree)))
+
+    monkeypatch.setattr(utils_seo, "orjson", None)
+    expected = decode(utils_seo, parse_html(NAN_LD_JSON_HTML))
+    monkeypatch.undo()
+
+    schemas = utils_seo.extract_structured_data(parse_html(NAN_LD_JSON_HTML))
+    assert [schema.type for schema in schemas] == ["FAQPage"]
+    assert decode(utils_seo, parse_html(NAN_LD_JSON_HTML)) == expected
+    utils_seo_selectolax = pytest.importorskip("utils_seo_selectolax")
+    if utils_seo_selectolax.SELECTOLAX_AVAILABLE:
+        tree = utils_seo_selectolax.parse_html(NAN_LD_JSON_HTML)
+        assert decode(utils_seo_selectolax, tree) == expected
+
+
+def test_canonical_ignores_path_params_like_original() -> None:
+    # urlparse, used by the original normalize_url, split ";params" off the path
+    page_url = "https://example.com/page;jsessionid=1"
+    soup = parse_html('<link rel="canonical" href="https://example.com/page">')
+    assert utils_seo.extract_canonical(soup, page_url).is_self is True
+    assert utils_seo.normalize_url(page_url) == "https://example.com/page"
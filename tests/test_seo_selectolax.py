@@ -0,0 +1,83 @@
+"""Parity tests: the Lexbor extractors must match the bs4 extractors in utils_seo."""
+
+import pytest
+
+import utils_seo
+from utils_html import parse_html
+
+pytest.importorskip("selectolax")
+import utils_seo_selectolax  # noqa: E402
+
+HIDDEN_TEXT_HTML = """
+<h1>One<script>var x=1</script><style>a{}</style><template>T<b>tb</b></template>
+<ruby>漢<rp>(</rp><rt>k<b>an</b></rt><rp>)</rp></ruby><!--c--><noscript>ns</noscript>Two</h1>
+<h2> Plain <i>x</i></h2>
+<h3><script>only script</script></h3>
+<details><summary>S<script>1</script>?</summary><script>own text</script>ans<!--c--><p>p<style>x</style></p></details>
+<dl><dt>D<rt>r</rt></dt><dd>dd<script>s</script></dd></dl>
+<div class="faq"><h3>H<script>z</script></h3><p>P<script>w</script></p></div>
+"""
+
+LD_JSON_TYPE_HTML = """
+<script type="application/LD+JSON">
+{"@type": "FAQPage", "mainEntity": {"@type": "Question", "name": "Upper?",
+ "acceptedAnswer": {"text": "Skipped by bs4"}}}
+</script>
+<script type="application/ld+json">
+{"@type": "FAQPage", "mainEntity": {"@type": "Question", "name": "Lower?",
+ "acceptedAnswer": {"text": "Kept"}}}
+</script>
+<script src="/app.js" defer></script>
+<script>  </script>
+"""
+
+LINK_REL_CASE_HTML = """
+<link rel="Canonical" href="https://example.com/upper">
+<link rel="preload canonical" href="https://example.com/page">
+<link rel="Alternate" hreflang="de" href="https://example.com/de/">
+<link rel="alternate" hreflang="fr" href="https://example.com/fr/">
+"""
+
+EXTRACTORS = [
+    "extract_h1",
+    "extract_headings",
+    "extract_heading_outline",
+    "extract_structured_data",
+    "extract_scripts",
+    "extract_script_outline",
+    "extract_faq_sections",
+]
+
+
+@pytest.mark.parametrize("html", [HIDDEN_TEXT_HTML, LD_JSON_TYPE_HTML])
+@pytest.mark.parametrize("name", EXTRACTORS)
+def test_extractor_parity(name: str, html: str) -> None:
+    expected = getattr(utils_seo, name)(parse_html(html))
+    actual = getattr(utils_seo_selectolax, name)(utils_seo_selectolax.parse_html(html))
+    assert actual == expected
+
+
+def test_heading_text_skips_script_and_ruby_text() -> None:
+    tree = utils_seo_selectolax.parse_html(HIDDEN_TEXT_HTML)
+    assert utils_seo_selectolax.extract_h1(tree).text == "One漢nsTwo"
+
+
+def test_ld_json_type_is_case_sensitive() -> None:
+    tree = utils_seo_selectolax.parse_html(LD_JSON_TYPE_HTML)
+    schemas = utils_seo_selectolax.extract_structured_data(tree)
+    faqs = utils_seo_selectolax.extract_faq_sections(tree)
+    assert len(schemas) == 1
+    assert [faq.question for faq in faqs] == ["Lower?"]
+
+
+def test_link_rel_is_case_sensitive() -> None:
+    page_url = "https://example.com/page"
+    expected_canonical = utils_seo.extract_canonical(parse_html(LINK_REL_CASE_HTML), page_url)
+    expected_hreflang = utils_seo.extract_hreflang(parse_html(LINK_REL_CASE_HTML))
+    tree = utils_seo_selectolax.parse_html(LINK_REL_CASE_HTML)
+    canonical = utils_seo_selectolax.extract_canonical(tree, page_url)
+    hreflang = utils_seo_selectolax.extract_hreflang(tree)
+    assert canonical == expected_canonical
+    assert hreflang == expected_hreflang
+    assert canonical.url == "https://example.com/page"
+    assert [item.lang for item in hreflang] == ["fr"]
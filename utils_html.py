@@ -3,7 +3,31 @@
 from dataclasses import dataclass, field
 from urllib.parse import urljoin, urlparse
 
-from bs4 import BeautifulSoup, formatter
+from bs4 import BeautifulSoup, SoupStrainer, formatter
+
+
+def parse_html(
+    html: str | bytes,
+    encoding: str | None = None,
+    parse_only: SoupStrainer | None = None,
+) -> BeautifulSoup:
+    """Parse an HTML document with the C-based lxml tree builder.
+
+    This is the soup that the utils_seo and utils_links extractors expect.
+    Passing the encoding for bytes input skips charset detection.
+
+    Args:
+        html: The raw HTML content (str, or bytes in the given encoding).
+        encoding: Character encoding of bytes input, if known.
+        parse_only: Optional SoupStrainer limiting which tags are built
+                    (e.g., utils_seo.SEO_STRAINER).
+
+    Returns:
+        The parsed BeautifulSoup object.
+    """
+    if isinstance(html, bytes):
+        return BeautifulSoup(html, "lxml", from_encoding=encoding, parse_only=parse_only)
+    return BeautifulSoup(html, "lxml", parse_only=parse_only)
 
 
 def prettify_html(html: str) -> str:
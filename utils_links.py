@@ -2,6 +2,7 @@
 
 import asyncio
 import re
+from collections.abc import Sequence
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
 
@@ -16,14 +17,22 @@ from utils_requests import fetch_head
 
 # Image format extensions
 IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp", ".avif", ".svg"}
+IMAGE_EXTENSION_PATTERN = re.compile(
+    r"\.(" + "|".join(sorted(ext[1:] for ext in IMAGE_EXTENSIONS)) + r")$",
+    re.IGNORECASE,
+)
 
 # Patterns to detect logo/icon links
 LOGO_PATTERNS = re.compile(r"\b(logo|brand|site-logo|header-logo)\b", re.IGNORECASE)
 ICON_PATTERNS = re.compile(r"\b(icon|fa-|fab-|fas-|material-icons|glyphicon)\b", re.IGNORECASE)
 BUTTON_PATTERNS = re.compile(r"\b(btn|button|cta)\b", re.IGNORECASE)
 
+# Leading (optionally signed) integer of a width/height attribute
+# (e.g., "100px" -> "100", "-5" -> "-5")
+DIMENSION_PATTERN = re.compile(r"^\s*([+-]?\d+)")
 
-def _detect_link_content_type(anchor: Tag) -> str:
+
+def _detect_link_content_type(anchor: Tag, text: str | None = None) -> str:
     """Detect the content type of an anchor element.
 
     Analyzes the contents of an <a> tag to determine what it contains:
@@ -36,8 +45,12 @@ def _detect_link_content_type(anchor: Tag) -> str:
     - mixed: Contains both text and image/icon
     - empty: No content at all
 
+    All child elements are inspected in a single walk over the anchor's
+    descendants instead of one find_all() per element kind.
+
     Args:
         anchor: BeautifulSoup Tag object for the <a> element.
+        text: Pre-computed stripped anchor text, if the caller already has it.
 
     Returns:
         Content type string.
@@ -46,44 +59,55 @@ def _detect_link_content_type(anchor: Tag) -> str:
     anchor_classes = " ".join(anchor.get("class", []))
     anchor_id = anchor.get("id", "") or ""
 
-    # Check for images
-    images = anchor.find_all("img")
-    has_image = len(images) > 0
-
-    # Check for SVG
-    svgs = anchor.find_all("svg")
-    has_svg = len(svgs) > 0
-
-    # Check for icon elements (font icons like FontAwesome, Material Icons)
-    icons = anchor.find_all("i") + anchor.find_all("span", class_=ICON_PATTERNS)
-    has_icon = len(icons) > 0
+    # Fast path: most anchors contain only text, so skip the descendant walk
+    if not any(isinstance(child, Tag) for child in anchor.children):
+        if text is None:
+            text = anchor.get_text(strip=True)
+        if not text:
+            return "empty"
+        if LOGO_PATTERNS.search(anchor_classes) or LOGO_PATTERNS.search(anchor_id):
+            return "logo"
+        if BUTTON_PATTERNS.search(anchor_classes):
+            return "button"
+        return "text"
+
+    has_image = False
+    has_svg = False
+    has_icon = False
+    is_logo = False
 
-    # Check if any child has icon-like classes
     for child in anchor.descendants:
-        if isinstance(child, Tag):
-            child_classes = " ".join(child.get("class", []))
-            if ICON_PATTERNS.search(child_classes):
-                has_icon = True
-                break
+        if not isinstance(child, Tag):
+            continue
+        child_classes = " ".join(child.get("class", []))
+
+        if child.name == "img":
+            has_image = True
+            # Determine if this image is a logo
+            if not is_logo:
+                img_alt = child.get("alt", "") or ""
+                img_src = child.get("src", "") or ""
+                if (
+                    LOGO_PATTERNS.search(child_classes)
+                    or LOGO_PATTERNS.search(img_alt)
+                    or LOGO_PATTERNS.search(img_src)
+                ):
+                    is_logo = True
+        elif child.name == "svg":
+            has_svg = True
+        elif child.name == "i":
+            # Font icons like FontAwesome, Material Icons
+            has_icon = True
+
+        # Check if any child has icon-like classes
+        if not has_icon and ICON_PATTERNS.search(child_classes):
+            has_icon = True
 
     # Get text content
-    text = anchor.get_text(strip=True)
+    if text is None:
+        text = anchor.get_text(strip=True)
     has_text = bool(text)
 
-    # Determine if this is a logo
-    is_logo = False
-    if has_image:
-        for img in images:
-            img_classes = " ".join(img.get("class", []))
-            img_alt = img.get("alt", "") or ""
-            img_src = img.get("src", "") or ""
-            if (
-                LOGO_PATTERNS.search(img_classes)
-                or LOGO_PATTERNS.search(img_alt)
-                or LOGO_PATTERNS.search(img_src)
-            ):
-                is_logo = True
-                break
     # Check anchor itself for logo patterns
     if LOGO_PATTERNS.search(anchor_classes) or LOGO_PATTERNS.search(anchor_id):
         is_logo = True
@@ -168,20 +192,20 @@ def extract_links(
             rel_list = list(rel_attr)
 
         # Detect content type
-        content_type = _detect_link_content_type(anchor)
+        content_type = _detect_link_content_type(anchor, anchor_text)
 
+        is_internal = is_same_domain(absolute_url, site_url)
         link_info = LinkInfo(
             href=absolute_url,
             anchor=anchor_text,
             rel=rel_list,
+            is_internal=is_internal,
             content_type=content_type,
         )
 
-        if is_same_domain(absolute_url, site_url):
-            link_info.is_internal = True
+        if is_internal:
             internal_links.append(link_info)
         else:
-            link_info.is_internal = False
             external_links.append(link_info)
 
     return internal_links, external_links
@@ -203,17 +227,15 @@ def extract_images(soup: BeautifulSoup, base_url: str) -> list[ImageInfo]:
     images: list[ImageInfo] = []
 
     for img in soup.find_all("img"):
+        # BeautifulSoup only returns lists for multi-valued attributes such as
+        # class/rel, so every <img> attribute read here is a plain string.
+        attrs = img.attrs
+
         # Get src (could be in src or data-src for lazy loading)
-        src = img.get("src", "")
-        if isinstance(src, list):
-            src = src[0] if src else ""
-        src = src.strip()
+        src = attrs.get("src", "").strip()
 
         # If no src, try data-src
-        data_src = img.get("data-src", "")
-        if isinstance(data_src, list):
-            data_src = data_src[0] if data_src else ""
-        data_src = data_src.strip()
+        data_src = attrs.get("data-src", "").strip()
 
         # Use data-src as fallback if src is empty or a placeholder
         effective_src = src
@@ -228,33 +250,28 @@ def extract_images(soup: BeautifulSoup, base_url: str) -> list[ImageInfo]:
         absolute_src = urljoin(base_url, effective_src)
 
         # Get alt text
-        alt = img.get("alt")
-        if isinstance(alt, list):
-            alt = alt[0] if alt else None
+        alt = attrs.get("alt")
 
         # Check for lazy loading
         has_lazy = False
-        loading_attr = img.get("loading", "")
-        if isinstance(loading_attr, list):
-            loading_attr = loading_attr[0] if loading_attr else ""
-        if loading_attr.lower() == "lazy":
+        if attrs.get("loading", "").lower() == "lazy":
             has_lazy = True
-        if img.get("data-src") or img.get("data-lazy"):
+        if data_src or attrs.get("data-lazy"):
             has_lazy = True
 
         # Detect format from URL extension
         img_format = _detect_image_format(absolute_src)
 
         # Extract width and height
-        width = _parse_dimension(img.get("width"))
-        height = _parse_dimension(img.get("height"))
+        width = _parse_dimension(attrs.get("width"))
+        height = _parse_dimension(attrs.get("height"))
 
-        # Check for issues
-        issues: list[str] = []
+        # Check for issues (the empty tuple is shared, so clean images allocate nothing)
+        issues: Sequence[str] = ()
         if alt is None:
-            issues.append("Missing alt text")
+            issues = ["Missing alt text"]
         elif alt == "":
-            issues.append("Empty alt text")
+            issues = ["Empty alt text"]
 
         images.append(
             ImageInfo(
@@ -280,16 +297,14 @@ def _detect_image_format(url: str) -> str | None:
     Returns:
         Format string (jpg, png, gif, webp, avif, svg) or None if unknown.
     """
-    parsed = urlparse(url)
-    path = parsed.path.lower()
-
-    for ext in IMAGE_EXTENSIONS:
-        if path.endswith(ext):
-            # Normalize jpeg to jpg
-            fmt = ext.lstrip(".")
-            return "jpg" if fmt == "jpeg" else fmt
+    # Case-insensitive match avoids lowercasing the whole path
+    match = IMAGE_EXTENSION_PATTERN.search(urlparse(url).path)
+    if not match:
+        return None
 
-    return None
+    # Normalize jpeg to jpg
+    fmt = match.group(1).lower()
+    return "jpg" if fmt == "jpeg" else fmt
 
 
 def _parse_dimension(value: str | list | None) -> int | None:
@@ -301,21 +316,14 @@ def _parse_dimension(value: str | list | None) -> int | None:
     Returns:
         Integer value or None if parsing fails.
     """
-    if value is None:
-        return None
     if isinstance(value, list):
         value = value[0] if value else None
-    if value is None:
+    if not value:
         return None
 
-    # Strip any units (e.g., "100px" -> "100")
-    value = str(value).strip().lower()
-    value = value.rstrip("px").rstrip("%").strip()
-
-    try:
-        return int(value)
-    except ValueError:
-        return None
+    # Take the leading integer, ignoring any units (e.g., "100px", "50%")
+    match = DIMENSION_PATTERN.match(str(value))
+    return int(match.group(1)) if match else None
 
 
 def lookup_internal_link_status(
@@ -1,14 +1,35 @@
-"""Utility functions for extracting SEO elements from HTML pages."""
+"""Utility functions for extracting SEO elements from HTML pages.
+
+The extract_* functions take a BeautifulSoup tree built with the "lxml"
+parser (see utils_html.parse_html); the pure-Python "html.parser" builder is
+several times slower on real pages.
+
+When only head and heading data is needed, build the soup with
+parse_only=SEO_STRAINER to skip the rest of the DOM.
+"""
 
 import json
 import re
+import sys
+from bisect import bisect_right
 from collections import Counter
-from urllib.parse import urlparse
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import pairwise
+from operator import itemgetter
+
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
 
-from bs4 import BeautifulSoup
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from models_seo import (
     CanonicalInfo,
+    DocumentSEOInfo,
     FAQInfo,
     HeadingInfo,
     HeadingItem,
@@ -18,7 +39,9 @@ from models_seo import (
     KeywordTerm,
     LocalizationInfo,
     MetaInfo,
+    MetaTagsInfo,
     OpenGraphInfo,
+    PageSEOData,
     RobotsInfo,
     SchemaInfo,
     ScriptInfo,
@@ -26,24 +49,174 @@ from models_seo import (
     TwitterCardInfo,
     ViewportInfo,
 )
+from utils_html import parse_html
+
+
+# Tags read by the head, heading and JSON-LD extractors. A soup built with
+# parse_only=SEO_STRAINER supports extract_title, extract_meta_description,
+# extract_canonical, extract_robots_meta, extract_all_meta, extract_h1,
+# extract_headings, extract_heading_outline, extract_open_graph,
+# extract_twitter_card, extract_structured_data, extract_viewport,
+# extract_hreflang, extract_scripts and extract_script_outline. Body-level
+# extractors (links, images, FAQ, keywords) and extract_localization need the
+# full soup; parse once without a strainer when both kinds are needed.
+SEO_STRAINER = SoupStrainer(["title", "meta", "link", "h1", "h2", "h3", "h4", "script"])
+
+# Entries kept by the memoized canonical URL keys
+URL_CACHE_SIZE = 8192
+
+# Shared issues value for the no-issue case, so clean pages don't allocate
+# an empty list per extractor. Treat issue sequences as read-only.
+_NO_ISSUES: tuple[str, ...] = ()
+
+# Length buckets for title/meta description rules: the issue for a length is
+# ISSUES[bisect_right(BOUNDS, length)], with None meaning the length is fine.
+_TITLE_LENGTH_BOUNDS = (1, 30, 61)
+_TITLE_LENGTH_ISSUES = (
+    "Missing title tag",
+    "Title too short (<30 chars)",
+    None,
+    "Title too long (>60 chars)",
+)
+_META_DESCRIPTION_LENGTH_BOUNDS = (1, 70, 161)
+_META_DESCRIPTION_LENGTH_ISSUES = (
+    "Missing meta description",
+    "Meta description too short (<70 chars)",
+    None,
+    "Meta description too long (>160 chars)",
+)
+
+# A JSON object or array, optionally preceded by whitespace
+JSON_CONTAINER_START_PATTERN = re.compile(r"\s*[\[{]")
+
+# Heading tag names indexed by level (index 0 unused)
+_H_NAMES = ("h0", "h1", "h2", "h3", "h4", "h5", "h6")
+
+# Headings covered by the hierarchy check, and their levels. The strainer is
+# built once instead of bs4 rebuilding a matcher from a name list per search.
+_LEVEL_MAP = {"h1": 1, "h2": 2, "h3": 3, "h4": 4}
+_HEADING_TAGS = SoupStrainer(list(_LEVEL_MAP))
+
+# Case-insensitive noindex directive lookup (avoids lowercasing the robots value).
+# Whole-word match, so e.g. "noindexed" in free text is not a directive.
+NOINDEX_PATTERN = re.compile(r"\bnoindex\b", re.IGNORECASE)
+
+# width=device-width in a viewport, tolerating spaces and case but not
+# matching other keys such as min-width
+VIEWPORT_DEVICE_WIDTH_PATTERN = re.compile(r"(?<![\w-])width\s*=\s*device-width", re.IGNORECASE)
+
+# PostalAddress fields joined into a one-line address, in output order. Event
+# locations use the shorter street/locality/region form.
+_ADDRESS_FIELDS = (
+    "streetAddress",
+    "addressLocality",
+    "addressRegion",
+    "postalCode",
+    "addressCountry",
+)
+_EVENT_ADDRESS_FIELDS = _ADDRESS_FIELDS[:3]
+
+
+def _json_loads(content: str) -> object:
+    """Decode JSON with orjson when installed, else with the stdlib json module.
+
+    Content orjson rejects but json accepts (NaN, Infinity) is retried with
+    json, so both decoders read the same JSON-LD blocks.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
+
+def _split_url(url: str) -> tuple[str, str, str, str]:
+    """Split a URL into (scheme, netloc, path, query), dropping the fragment.
+
+    A minimal str.partition-based splitter for the URL comparisons in this
+    module; urlparse's extra work (userinfo, validation) is not needed. Like
+    urlparse, ";params" on the last path segment are dropped from the path.
+    """
+    url, _, _ = url.partition("#")
+    url, _, query = url.partition("?")
+    scheme, sep, rest = url.partition("://")
+    if not sep or "/" in scheme:
+        scheme = ""
+        if url.startswith("//"):
+            rest = url[2:]
+        else:
+            return "", "", _strip_params(url), query
+    netloc, slash, path = rest.partition("/")
+    return scheme.lower(), netloc, _strip_params(slash + path), query
+
+
+def _strip_params(path: str) -> str:
+    """Drop ";params" from the last segment of a URL path, as urlparse does."""
+    if ";" not in path:
+        return path
+    index = path.find(";", path.rfind("/") + 1)
+    return path if index < 0 else path[:index]
 
 
 def normalize_url(url: str) -> str:
     """Normalize a URL for comparison by removing trailing slashes and fragments.
 
+    Only the scheme and host are lowercased; paths and query strings are
+    case-sensitive and kept as-is.
+
     Args:
         url: The URL to normalize.
 
     Returns:
         The normalized URL string.
     """
-    parsed = urlparse(url)
+    scheme, netloc, path, query = _split_url(url)
     # Rebuild without fragment, normalize path
-    path = parsed.path.rstrip("/") or "/"
-    normalized = f"{parsed.scheme}://{parsed.netloc}{path}"
-    if parsed.query:
-        normalized += f"?{parsed.query}"
-    return normalized.lower()
+    path = path.rstrip("/") or "/"
+    normalized = f"{scheme}://{netloc.lower()}{path}"
+    if query:
+        normalized += f"?{query}"
+    return normalized
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def _url_key(url: str) -> tuple[str, str, str, str]:
+    """Build a comparison key for a URL without rebuilding a URL string.
+
+    Two URLs have equal keys exactly when their normalize_url() results are
+    equal.
+
+    Args:
+        url: The URL to build a key for.
+
+    Returns:
+        A (scheme, netloc, path, query) tuple with the scheme and netloc
+        lowercased and trailing slashes stripped from the path.
+    """
+    scheme, netloc, path, query = _split_url(url)
+    return (scheme, netloc.lower(), path.rstrip("/") or "/", query)
+
+
+def _build_title_info(text: str | None) -> TitleInfo:
+    """Build TitleInfo from raw title text and apply the length rules.
+
+    Args:
+        text: The raw title text, or None if the tag is missing.
+
+    Returns:
+        TitleInfo with the title text, length, and any SEO issues.
+    """
+    if not text:
+        return TitleInfo(text=None, length=0, issues=["Missing title tag"])
+
+    text = text.strip()
+    length = len(text)
+    issue = _TITLE_LENGTH_ISSUES[bisect_right(_TITLE_LENGTH_BOUNDS, length)]
+
+    return TitleInfo(
+        text=text if text else None, length=length, issues=[issue] if issue else _NO_ISSUES
+    )
 
 
 def extract_title(soup: BeautifulSoup) -> TitleInfo:
@@ -55,23 +228,32 @@ def extract_title(soup: BeautifulSoup) -> TitleInfo:
     Returns:
         TitleInfo with the title text, length, and any SEO issues.
     """
-    issues: list[str] = []
-    title_tag = soup.find("title")
+    # First <title> only; the search stops at the first match (in <head>)
+    title_tag = soup.title
+    return _build_title_info(title_tag.string if title_tag else None)
 
-    if not title_tag or not title_tag.string:
-        return TitleInfo(text=None, length=0, issues=["Missing title tag"])
 
-    text = title_tag.string.strip()
-    length = len(text)
+def _build_meta_description_info(content: str | None) -> MetaInfo:
+    """Build MetaInfo from a meta description value and apply the length rules.
+
+    Args:
+        content: The content attribute, or None if the tag is missing.
 
-    if length == 0:
-        issues.append("Missing title tag")
-    elif length < 30:
-        issues.append("Title too short (<30 chars)")
-    elif length > 60:
-        issues.append("Title too long (>60 chars)")
+    Returns:
+        MetaInfo with the description text, length, and any SEO issues.
+    """
+    if content is None:
+        return MetaInfo(text=None, length=0, issues=["Missing meta description"])
+
+    text = content.strip()
+    length = len(text)
+    issue = _META_DESCRIPTION_LENGTH_ISSUES[
+        bisect_right(_META_DESCRIPTION_LENGTH_BOUNDS, length)
+    ]
 
-    return TitleInfo(text=text if text else None, length=length, issues=issues)
+    return MetaInfo(
+        text=text if text else None, length=length, issues=[issue] if issue else _NO_ISSUES
+    )
 
 
 def extract_meta_description(soup: BeautifulSoup) -> MetaInfo:
@@ -83,26 +265,48 @@ def extract_meta_description(soup: BeautifulSoup) -> MetaInfo:
     Returns:
         MetaInfo with the description text, length, and any SEO issues.
     """
-    issues: list[str] = []
     meta_tag = soup.find("meta", attrs={"name": "description"})
 
     if not meta_tag:
-        return MetaInfo(text=None, length=0, issues=["Missing meta description"])
+        return _build_meta_description_info(None)
 
-    content = meta_tag.get("content", "")
-    if isinstance(content, list):
-        content = content[0] if content else ""
-    text = content.strip()
-    length = len(text)
+    # bs4 only returns lists for multi-valued attributes (class, rel, ...);
+    # content, href, lang and src are always plain strings
+    return _build_meta_description_info(meta_tag.get("content") or "")
 
-    if length == 0:
-        issues.append("Missing meta description")
-    elif length < 70:
-        issues.append("Meta description too short (<70 chars)")
-    elif length > 160:
-        issues.append("Meta description too long (>160 chars)")
 
-    return MetaInfo(text=text if text else None, length=length, issues=issues)
+def _build_canonical_info(href: str | None, page_url: str) -> CanonicalInfo:
+    """Build CanonicalInfo from a canonical href and check it against the page.
+
+    Args:
+        href: The canonical href attribute, or None if the tag is missing.
+        page_url: The URL of the current page for self-referencing check.
+
+    Returns:
+        CanonicalInfo with the canonical URL, self-reference status, and any issues.
+    """
+    url = href.strip() if href else ""
+
+    if not url:
+        return CanonicalInfo(url=None, is_self=False, issues=["Missing canonical tag"])
+
+    issues: Sequence[str] = _NO_ISSUES
+
+    # Keys are memoized, so page_url is only parsed once per crawl
+    canonical_key = _url_key(url)
+    page_key = _url_key(page_url)
+
+    # Check if canonical is self-referencing
+    is_self = canonical_key == page_key
+
+    # Check if canonical points to a different domain (keys hold the lowercased netloc)
+    canonical_domain = canonical_key[1]
+    page_domain = page_key[1]
+
+    if canonical_domain and page_domain and canonical_domain != page_domain:
+        issues = ["Canonical points to different domain"]
+
+    return CanonicalInfo(url=url, is_self=is_self, issues=issues)
 
 
 def extract_canonical(soup: BeautifulSoup, page_url: str) -> CanonicalInfo:
@@ -115,33 +319,38 @@ def extract_canonical(soup: BeautifulSoup, page_url: str) -> CanonicalInfo:
     Returns:
         CanonicalInfo with the canonical URL, self-reference status, and any issues.
     """
-    issues: list[str] = []
     canonical_tag = soup.find("link", rel="canonical")
 
     if not canonical_tag:
-        return CanonicalInfo(url=None, is_self=False, issues=["Missing canonical tag"])
+        return _build_canonical_info(None, page_url)
 
-    href = canonical_tag.get("href", "")
-    if isinstance(href, list):
-        href = href[0] if href else ""
-    url = href.strip()
+    return _build_canonical_info(canonical_tag.get("href") or "", page_url)
 
-    if not url:
-        return CanonicalInfo(url=None, is_self=False, issues=["Missing canonical tag"])
 
-    # Check if canonical is self-referencing
-    is_self = normalize_url(url) == normalize_url(page_url)
+def _build_robots_info(content: str | None) -> RobotsInfo:
+    """Build RobotsInfo from a robots meta value and determine indexability.
 
-    # Check if canonical points to a different domain
-    canonical_parsed = urlparse(url)
-    page_parsed = urlparse(page_url)
-    canonical_domain = canonical_parsed.netloc.lower()
-    page_domain = page_parsed.netloc.lower()
+    Args:
+        content: The content attribute, or None if the tag is missing.
 
-    if canonical_domain and page_domain and canonical_domain != page_domain:
-        issues.append("Canonical points to different domain")
+    Returns:
+        RobotsInfo with robots directives, indexability status, and any issues.
+    """
+    issues: Sequence[str] = _NO_ISSUES
+    meta_robots = content.strip() if content and content.strip() else None
 
-    return CanonicalInfo(url=url, is_self=is_self, issues=issues)
+    # Determine indexability - default is True unless noindex is found
+    indexable = True
+    if meta_robots and NOINDEX_PATTERN.search(meta_robots):
+        indexable = False
+        issues = ["Page is set to noindex"]
+
+    return RobotsInfo(
+        meta_robots=meta_robots,
+        x_robots_tag=None,  # Comes from HTTP headers, not HTML
+        indexable=indexable,
+        issues=issues,
+    )
 
 
 def extract_robots_meta(soup: BeautifulSoup) -> RobotsInfo:
@@ -155,30 +364,38 @@ def extract_robots_meta(soup: BeautifulSoup) -> RobotsInfo:
     Returns:
         RobotsInfo with robots directives, indexability status, and any issues.
     """
-    issues: list[str] = []
     robots_tag = soup.find("meta", attrs={"name": "robots"})
 
-    meta_robots: str | None = None
+    content: str | None = None
     if robots_tag:
-        content = robots_tag.get("content", "")
-        if isinstance(content, list):
-            content = content[0] if content else ""
-        meta_robots = content.strip() if content.strip() else None
+        content = robots_tag.get("content") or ""
+    return _build_robots_info(content)
 
-    # Determine indexability - default is True unless noindex is found
-    indexable = True
-    if meta_robots:
-        robots_lower = meta_robots.lower()
-        if "noindex" in robots_lower:
-            indexable = False
-            issues.append("Page is set to noindex")
 
-    return RobotsInfo(
-        meta_robots=meta_robots,
-        x_robots_tag=None,  # Comes from HTTP headers, not HTML
-        indexable=indexable,
-        issues=issues,
-    )
+@lru_cache(maxsize=64)
+def _multiple_h1_message(count: int) -> str:
+    """Format the multiple-H1 issue, reusing one string per H1 count across pages."""
+    return f"Multiple H1 tags found (count: {count})"
+
+
+def _build_h1_info(first_text: str, count: int) -> HeadingInfo:
+    """Build HeadingInfo for H1 tags from the first H1 text and the H1 count.
+
+    Args:
+        first_text: Stripped text of the first H1 (ignored when count is 0).
+        count: Number of H1 tags on the page.
+
+    Returns:
+        HeadingInfo with the first H1 text, count of all H1s, and any issues.
+    """
+    if count == 0:
+        return HeadingInfo(text=None, count=0, issues=["Missing H1 tag"])
+
+    issues: Sequence[str] = _NO_ISSUES
+    if count > 1:
+        issues = [_multiple_h1_message(count)]
+
+    return HeadingInfo(text=first_text if first_text else None, count=count, issues=issues)
 
 
 def extract_h1(soup: BeautifulSoup) -> HeadingInfo:
@@ -190,21 +407,57 @@ def extract_h1(soup: BeautifulSoup) -> HeadingInfo:
     Returns:
         HeadingInfo with the first H1 text, count of all H1s, and any issues.
     """
-    issues: list[str] = []
     h1_tags = soup.find_all("h1")
-    count = len(h1_tags)
-
-    if count == 0:
-        return HeadingInfo(text=None, count=0, issues=["Missing H1 tag"])
+    if not h1_tags:
+        return _build_h1_info("", 0)
 
     # Get text of first H1
-    first_h1 = h1_tags[0]
-    text = first_h1.get_text(strip=True)
+    return _build_h1_info(h1_tags[0].get_text(strip=True), len(h1_tags))
 
-    if count > 1:
-        issues.append(f"Multiple H1 tags found (count: {count})")
 
-    return HeadingInfo(text=text if text else None, count=count, issues=issues)
+def _find_heading_skips(levels: list[int]) -> list[tuple[int, int]]:
+    """Find the (previous, current) level pairs where the hierarchy skips a level.
+
+    Only skips going down (increasing level numbers) count; the first heading
+    may be at any level.
+    """
+    # Pair each level with its predecessor without slicing a copy of the list
+    return [
+        (prev_level, current_level)
+        for prev_level, current_level in pairwise(levels)
+        if current_level > prev_level + 1
+    ]
+
+
+@lru_cache(maxsize=None)
+def _heading_skip_message(prev_level: int, current_level: int) -> str:
+    """Format the hierarchy skip issue for a level pair.
+
+    Only a handful of (prev, current) pairs exist, so each message is built
+    once and reused across all pages.
+    """
+    skipped_levels = ", ".join(_H_NAMES[prev_level + 1 : current_level])
+    return (
+        f"Heading hierarchy skip: {_H_NAMES[prev_level]} -> {_H_NAMES[current_level]} "
+        f"(missing {skipped_levels})"
+    )
+
+
+def _build_headings_hierarchy(headings: list[HeadingItem]) -> HeadingsHierarchy:
+    """Validate the heading order and build HeadingsHierarchy.
+
+    Args:
+        headings: Headings in document order.
+
+    Returns:
+        HeadingsHierarchy with all headings and any hierarchy issues.
+    """
+    skips = _find_heading_skips([heading.level for heading in headings])
+    if not skips:
+        return HeadingsHierarchy(headings=headings, issues=_NO_ISSUES)
+
+    issues = [_heading_skip_message(prev, current) for prev, current in skips]
+    return HeadingsHierarchy(headings=headings, issues=issues)
 
 
 def extract_headings(soup: BeautifulSoup) -> HeadingsHierarchy:
@@ -216,58 +469,41 @@ def extract_headings(soup: BeautifulSoup) -> HeadingsHierarchy:
     Returns:
         HeadingsHierarchy with all headings and any hierarchy issues.
     """
-    issues: list[str] = []
     headings: list[HeadingItem] = []
 
-    heading_tags = soup.find_all(["h1", "h2", "h3", "h4"])
+    heading_tags = soup.find_all(_HEADING_TAGS)
 
     for tag in heading_tags:
         tag_name = tag.name
-        level = int(tag_name[1])
+        level = _LEVEL_MAP[tag_name]
         text = tag.get_text(strip=True)
         headings.append(HeadingItem(tag=tag_name, text=text, level=level))
 
-    # Validate hierarchy: check for skipped levels
-    prev_level = 0
-    for heading in headings:
-        current_level = heading.level
-        # Only check for skipped levels going down (increasing level numbers)
-        if current_level > prev_level + 1 and prev_level > 0:
-            skipped_levels = [f"h{i}" for i in range(prev_level + 1, current_level)]
-            issues.append(
-                f"Heading hierarchy skip: h{prev_level} -> h{current_level} "
-                f"(missing {', '.join(skipped_levels)})"
-            )
-        prev_level = current_level
+    return _build_headings_hierarchy(headings)
 
-    return HeadingsHierarchy(headings=headings, issues=issues)
 
+def extract_heading_outline(
+    soup: BeautifulSoup,
+) -> tuple[HeadingInfo, HeadingsHierarchy]:
+    """Extract H1 info and the heading hierarchy from a single heading search.
 
-def extract_open_graph(soup: BeautifulSoup) -> OpenGraphInfo:
-    """Extract Open Graph meta tags for social sharing.
+    Equivalent to calling extract_h1 and extract_headings, but the H1 info is
+    derived from the heading list instead of walking the tree a second time.
 
     Args:
         soup: A BeautifulSoup object of the parsed HTML.
 
     Returns:
-        OpenGraphInfo with extracted OG properties.
+        Tuple of (HeadingInfo for H1 tags, HeadingsHierarchy for h1-h4).
     """
-    all_tags: dict[str, str] = {}
+    hierarchy = extract_headings(soup)
+    h1_texts = [heading.text for heading in hierarchy.headings if heading.level == 1]
+    h1 = _build_h1_info(h1_texts[0] if h1_texts else "", len(h1_texts))
+    return h1, hierarchy
 
-    og_tags = soup.find_all("meta", attrs={"property": lambda x: x and x.startswith("og:")})
-
-    for tag in og_tags:
-        prop = tag.get("property", "")
-        content = tag.get("content", "")
-        if isinstance(prop, list):
-            prop = prop[0] if prop else ""
-        if isinstance(content, list):
-            content = content[0] if content else ""
-        if prop and content:
-            # Store without og: prefix in all_tags
-            key = prop[3:] if prop.startswith("og:") else prop
-            all_tags[key] = content
 
+def _build_open_graph_info(all_tags: dict[str, str]) -> OpenGraphInfo:
+    """Build OpenGraphInfo from OG properties keyed without the og: prefix."""
     return OpenGraphInfo(
         title=all_tags.get("title"),
         description=all_tags.get("description"),
@@ -278,38 +514,31 @@ def extract_open_graph(soup: BeautifulSoup) -> OpenGraphInfo:
     )
 
 
-def extract_twitter_card(soup: BeautifulSoup) -> TwitterCardInfo:
-    """Extract Twitter Card meta tags for social sharing.
+def extract_open_graph(soup: BeautifulSoup) -> OpenGraphInfo:
+    """Extract Open Graph meta tags for social sharing.
 
     Args:
         soup: A BeautifulSoup object of the parsed HTML.
 
     Returns:
-        TwitterCardInfo with extracted Twitter Card properties.
+        OpenGraphInfo with extracted OG properties.
     """
     all_tags: dict[str, str] = {}
 
-    # Twitter cards can use either name or property attribute
-    twitter_tags_name = soup.find_all(
-        "meta", attrs={"name": lambda x: x and x.startswith("twitter:")}
-    )
-    twitter_tags_property = soup.find_all(
-        "meta", attrs={"property": lambda x: x and x.startswith("twitter:")}
-    )
+    # Plain loop with a prefix check; a lambda attribute filter would be
+    # called back by BeautifulSoup for every tag in the document.
+    for tag in soup.find_all("meta"):
+        prop = tag.get("property")
+        content = tag.get("content")
+        if prop and content and prop.startswith("og:"):
+            # Store without og: prefix in all_tags
+            all_tags[prop[3:]] = content
 
-    for tag in twitter_tags_name + twitter_tags_property:
-        # Get the attribute that contains the twitter: prefix
-        attr_name = tag.get("name") or tag.get("property") or ""
-        content = tag.get("content", "")
-        if isinstance(attr_name, list):
-            attr_name = attr_name[0] if attr_name else ""
-        if isinstance(content, list):
-            content = content[0] if content else ""
-        if attr_name and content:
-            # Store without twitter: prefix in all_tags
-            key = attr_name[8:] if attr_name.startswith("twitter:") else attr_name
-            all_tags[key] = content
+    return _build_open_graph_info(all_tags)
 
+
+def _build_twitter_card_info(all_tags: dict[str, str]) -> TwitterCardInfo:
+    """Build TwitterCardInfo from Twitter properties keyed without the twitter: prefix."""
     return TwitterCardInfo(
         card=all_tags.get("card"),
         title=all_tags.get("title"),
@@ -319,43 +548,144 @@ def extract_twitter_card(soup: BeautifulSoup) -> TwitterCardInfo:
     )
 
 
-def _get_schema_type(data: dict) -> str:
-    """Get normalized schema type from JSON-LD data.
+def extract_twitter_card(soup: BeautifulSoup) -> TwitterCardInfo:
+    """Extract Twitter Card meta tags for social sharing.
+
+    Args:
+        soup: A BeautifulSoup object of the parsed HTML.
+
+    Returns:
+        TwitterCardInfo with extracted Twitter Card properties.
+    """
+    tags_by_name: dict[str, str] = {}
+    tags_by_property: dict[str, str] = {}
+
+    # Twitter cards can use either name or property attribute
+    for tag in soup.find_all("meta"):
+        content = tag.get("content")
+        if not content:
+            continue
+        # Store without twitter: prefix in all_tags
+        name = tag.get("name")
+        if name and name.startswith("twitter:"):
+            tags_by_name[name[8:]] = content
+        prop = tag.get("property")
+        if prop and prop.startswith("twitter:"):
+            tags_by_property[prop[8:]] = content
+
+    # Property-based tags take precedence over name-based ones
+    all_tags = {**tags_by_name, **tags_by_property}
+    return _build_twitter_card_info(all_tags)
+
+
+def extract_all_meta(soup: BeautifulSoup) -> MetaTagsInfo:
+    """Extract meta description, robots, viewport, Open Graph and Twitter Card tags at once.
+
+    Walks the <meta> tags a single time and routes each one by its name or
+    property attribute, instead of one tree search per extractor. Results
+    match extract_meta_description, extract_robots_meta, extract_open_graph,
+    extract_twitter_card and extract_viewport.
+
+    Args:
+        soup: A BeautifulSoup object of the parsed HTML.
+
+    Returns:
+        MetaTagsInfo bundling MetaInfo, RobotsInfo, OpenGraphInfo, TwitterCardInfo
+        and ViewportInfo.
+    """
+    description: str | None = None
+    robots: str | None = None
+    viewport: str | None = None
+    og_tags: dict[str, str] = {}
+    twitter_by_name: dict[str, str] = {}
+    twitter_by_property: dict[str, str] = {}
+
+    for tag in soup.find_all("meta"):
+        name = tag.get("name")
+        prop = tag.get("property")
+        content = tag.get("content", "")
+
+        if name == "description":
+            if description is None:
+                description = content
+        elif name == "robots":
+            if robots is None:
+                robots = content
+        elif name == "viewport":
+            if viewport is None:
+                viewport = content
+        elif name and name.startswith("twitter:") and content:
+            twitter_by_name[name[8:]] = content
+
+        if prop and content:
+            prefix, colon, key = prop.partition(":")
+            if colon:
+                if prefix == "og":
+                    og_tags[key] = content
+                elif prefix == "twitter":
+                    twitter_by_property[key] = content
+
+    return MetaTagsInfo(
+        description=_build_meta_description_info(description),
+        robots=_build_robots_info(robots),
+        open_graph=_build_open_graph_info(og_tags),
+        # Property-based Twitter tags take precedence, as in extract_twitter_card
+        twitter_card=_build_twitter_card_info({**twitter_by_name, **twitter_by_property}),
+        viewport=_build_viewport_info(viewport),
+    )
+
+
+def _get_schema_type(data: dict) -> tuple[str, str]:
+    """Get normalized schema type and the primary type from JSON-LD data.
 
     Args:
         data: JSON-LD data dict.
 
     Returns:
-        Schema type as string, joined by comma if multiple types.
+        Tuple of (schema type joined by comma if multiple types, primary type
+        used to pick a parser). Both interned, since the same few types repeat
+        across every page of a crawl.
     """
     schema_type = data.get("@type", "Unknown")
-    if isinstance(schema_type, list):
-        return ", ".join(schema_type)
-    return schema_type
+    if type(schema_type) is str:
+        schema_type = sys.intern(schema_type)
+        # Common case: a single plain type is its own primary type
+        if "," not in schema_type:
+            return schema_type, sys.intern(schema_type.strip())
+    elif isinstance(schema_type, list):
+        schema_type = sys.intern(", ".join(schema_type))
+    else:
+        return schema_type, ""
+    return schema_type, sys.intern(schema_type.split(",", 1)[0].strip())
 
 
 def _get_str(data: dict, key: str) -> str | None:
     """Safely extract a string value from schema data."""
     val = data.get(key)
-    if val is None:
-        return None
-    if isinstance(val, str):
+    # JSON values are always exact types, so dispatch on type() rather than
+    # isinstance(); strings are the common case and are checked first
+    if type(val) is str:
+        return val
+    # Lists use their first item (nested lists included)
+    while type(val) is list:
+        if not val:
+            return None
+        val = val[0]
+    val_type = type(val)
+    if val_type is str:
         return val
-    if isinstance(val, dict):
+    if val_type is dict:
         return val.get("@value") or val.get("name") or val.get("url")
-    if isinstance(val, list) and val:
-        return _get_str({"v": val[0]}, "v")
     return str(val) if val else None
 
 
 def _get_int(data: dict, key: str) -> int | None:
     """Safely extract an integer value from schema data."""
     val = data.get(key)
-    if val is None:
-        return None
-    if isinstance(val, int):
+    val_type = type(val)
+    if val_type is int or val_type is bool:
         return val
-    if isinstance(val, str):
+    if val_type is str:
         try:
             return int(val)
         except ValueError:
@@ -366,11 +696,10 @@ def _get_int(data: dict, key: str) -> int | None:
 def _get_float(data: dict, key: str) -> float | None:
     """Safely extract a float value from schema data."""
     val = data.get(key)
-    if val is None:
-        return None
-    if isinstance(val, (int, float)):
+    val_type = type(val)
+    if val_type is float or val_type is int or val_type is bool:
         return float(val)
-    if isinstance(val, str):
+    if val_type is str:
         try:
             return float(val.replace(",", ""))
         except ValueError:
@@ -378,6 +707,30 @@ def _get_float(data: dict, key: str) -> float | None:
     return None
 
 
+def _coerce_media_url(val: object) -> str | None:
+    """Get a media URL from a schema value: a URL string, an object with a url,
+    or a list of those (first item used)."""
+    if type(val) is list:
+        val = val[0] if val else None
+    val_type = type(val)
+    if val_type is str:
+        return val or None
+    if val_type is dict:
+        return _get_str(val, "url")
+    return None
+
+
+def _coerce_media_urls(val: object) -> list[str]:
+    """Get all media URLs from a schema value (string, object, or list of those)."""
+    items = val if type(val) is list else [val]
+    urls: list[str] = []
+    for item in items:
+        url = _coerce_media_url(item)
+        if url:
+            urls.append(url)
+    return urls
+
+
 def _parse_faq_schema(data: dict) -> dict:
     """Parse FAQPage schema into normalized structure.
 
@@ -430,9 +783,9 @@ def _parse_product_schema(data: dict) -> dict:
     # Extract offers (price, currency, availability)
     offers = data.get("offers")
     if offers:
-        if isinstance(offers, list):
+        if type(offers) is list:
             offers = offers[0] if offers else {}
-        if isinstance(offers, dict):
+        if type(offers) is dict:
             parsed["price"] = _get_float(offers, "price")
             parsed["currency"] = _get_str(offers, "priceCurrency")
             availability = _get_str(offers, "availability")
@@ -446,16 +799,7 @@ def _parse_product_schema(data: dict) -> dict:
         parsed["review_count"] = _get_int(rating, "reviewCount") or _get_int(rating, "ratingCount")
 
     # Extract images
-    image = data.get("image")
-    if image:
-        if isinstance(image, str):
-            parsed["images"] = [image]
-        elif isinstance(image, list):
-            parsed["images"] = [img if isinstance(img, str) else img.get("url", "") for img in image if img]
-        elif isinstance(image, dict):
-            url = image.get("url")
-            if url:
-                parsed["images"] = [url]
+    parsed["images"] = _coerce_media_urls(data.get("image"))
 
     return parsed
 
@@ -496,18 +840,7 @@ def _parse_article_schema(data: dict) -> dict:
             parsed["author"] = authors if len(authors) > 1 else (authors[0] if authors else None)
 
     # Extract image
-    image = data.get("image")
-    if image:
-        if isinstance(image, str):
-            parsed["image"] = image
-        elif isinstance(image, dict):
-            parsed["image"] = _get_str(image, "url")
-        elif isinstance(image, list) and image:
-            first = image[0]
-            if isinstance(first, str):
-                parsed["image"] = first
-            elif isinstance(first, dict):
-                parsed["image"] = _get_str(first, "url")
+    parsed["image"] = _coerce_media_url(data.get("image"))
 
     return parsed
 
@@ -567,12 +900,7 @@ def _parse_organization_schema(data: dict) -> dict:
     }
 
     # Extract logo
-    logo = data.get("logo")
-    if logo:
-        if isinstance(logo, str):
-            parsed["logo"] = logo
-        elif isinstance(logo, dict):
-            parsed["logo"] = _get_str(logo, "url")
+    parsed["logo"] = _coerce_media_url(data.get("logo"))
 
     # Extract address
     address = data.get("address")
@@ -580,11 +908,7 @@ def _parse_organization_schema(data: dict) -> dict:
         if isinstance(address, str):
             parsed["address"] = address
         elif isinstance(address, dict):
-            parts = []
-            for field in ["streetAddress", "addressLocality", "addressRegion", "postalCode", "addressCountry"]:
-                val = _get_str(address, field)
-                if val:
-                    parts.append(val)
+            parts = list(filter(None, (_get_str(address, key) for key in _ADDRESS_FIELDS)))
             if parts:
                 parsed["address"] = ", ".join(parts)
 
@@ -600,7 +924,8 @@ def _parse_breadcrumb_schema(data: dict) -> dict:
     Returns:
         Dict with list of breadcrumb items with position, name, url.
     """
-    items = []
+    # (sort key, item) pairs; a missing position sorts as 0
+    keyed_items: list[tuple[int, dict]] = []
     item_list = data.get("itemListElement", [])
     if not isinstance(item_list, list):
         item_list = [item_list]
@@ -622,10 +947,10 @@ def _parse_breadcrumb_schema(data: dict) -> dict:
                     name = _get_str(item, "name")
 
         if name or url:
-            items.append({"position": position, "name": name, "url": url})
+            keyed_items.append((position or 0, {"position": position, "name": name, "url": url}))
 
-    items.sort(key=lambda x: x.get("position") or 0)
-    return {"items": items}
+    keyed_items.sort(key=itemgetter(0))
+    return {"items": [item for _, item in keyed_items]}
 
 
 def _parse_howto_schema(data: dict) -> dict:
@@ -678,7 +1003,7 @@ def _parse_recipe_schema(data: dict) -> dict:
     # Extract ingredients
     ingredients = data.get("recipeIngredient", [])
     if isinstance(ingredients, list):
-        parsed["ingredients"] = [str(i) for i in ingredients if i]
+        parsed["ingredients"] = [i if type(i) is str else str(i) for i in ingredients if i]
     elif ingredients:
         parsed["ingredients"] = [str(ingredients)]
 
@@ -722,26 +1047,21 @@ def _parse_event_schema(data: dict) -> dict:
             parsed["location"] = location
         elif isinstance(location, dict):
             loc_name = _get_str(location, "name")
+            parts = [loc_name] if loc_name else []
             loc_address = location.get("address")
             if loc_address and isinstance(loc_address, dict):
-                addr_parts = []
-                for field in ["streetAddress", "addressLocality", "addressRegion"]:
-                    val = _get_str(loc_address, field)
-                    if val:
-                        addr_parts.append(val)
-                if loc_name:
-                    parsed["location"] = f"{loc_name}, {', '.join(addr_parts)}" if addr_parts else loc_name
-                elif addr_parts:
-                    parsed["location"] = ", ".join(addr_parts)
-            elif loc_name:
-                parsed["location"] = loc_name
+                parts.extend(
+                    filter(None, (_get_str(loc_address, key) for key in _EVENT_ADDRESS_FIELDS))
+                )
+            # Name and address parts joined in one pass
+            parsed["location"] = ", ".join(parts) or None
 
     # Extract price from offers
     offers = data.get("offers")
     if offers:
-        if isinstance(offers, list):
+        if type(offers) is list:
             offers = offers[0] if offers else {}
-        if isinstance(offers, dict):
+        if type(offers) is dict:
             parsed["price"] = _get_float(offers, "price")
 
     return parsed
@@ -765,9 +1085,9 @@ def _parse_website_schema(data: dict) -> dict:
     # Extract search action
     potential_action = data.get("potentialAction")
     if potential_action:
-        if isinstance(potential_action, list):
+        if type(potential_action) is list:
             potential_action = potential_action[0] if potential_action else {}
-        if isinstance(potential_action, dict):
+        if type(potential_action) is dict:
             action_type = potential_action.get("@type", "")
             if action_type == "SearchAction":
                 target = potential_action.get("target")
@@ -836,6 +1156,64 @@ _SCHEMA_PARSERS: dict = {
 }
 
 
+def _iter_ld_items(data: object) -> Iterator[object]:
+    """Yield the schema objects of a decoded JSON-LD body without copying them.
+
+    Top-level arrays yield their items; objects with @graph yield the graph
+    entries (common pattern in modern websites); other objects yield themselves.
+    """
+    if isinstance(data, list):
+        yield from data
+    elif isinstance(data, dict):
+        if "@graph" in data:
+            graph = data["@graph"]
+            if isinstance(graph, list):
+                yield from graph
+            elif isinstance(graph, dict):
+                yield graph
+        else:
+            yield data
+
+
+def _parse_json_ld(content: str) -> list[SchemaInfo]:
+    """Parse one JSON-LD script body into SchemaInfo entries.
+
+    Args:
+        content: The text of a <script type="application/ld+json"> tag.
+
+    Returns:
+        List of SchemaInfo with type, raw data, and parsed fields. Empty if the
+        content is not valid JSON.
+    """
+    schemas: list[SchemaInfo] = []
+
+    # Only objects and arrays can yield schemas; skip other bodies (empty,
+    # templating placeholders, commented-out markup) without a decode attempt
+    if not JSON_CONTAINER_START_PATTERN.match(content):
+        return schemas
+
+    try:
+        # orjson only accepts exact str, not bs4's NavigableString subclass
+        data = _json_loads(str(content))
+    except ValueError:  # json.JSONDecodeError
+        return schemas
+
+    for item in _iter_ld_items(data):
+        if not isinstance(item, dict):
+            continue
+
+        schema_type, primary_type = _get_schema_type(item)
+
+        # Find and apply appropriate parser
+        parsed: dict = {}
+        if primary_type in _SCHEMA_PARSERS:
+            parsed = _SCHEMA_PARSERS[primary_type](item)
+
+        schemas.append(SchemaInfo(type=schema_type, raw=item, parsed=parsed))
+
+    return schemas
+
+
 def extract_structured_data(soup: BeautifulSoup) -> list[SchemaInfo]:
     """Extract JSON-LD structured data from the page.
 
@@ -854,84 +1232,56 @@ def extract_structured_data(soup: BeautifulSoup) -> list[SchemaInfo]:
 
     for tag in ld_json_tags:
         content = tag.string
-        if not content:
-            continue
-
-        try:
-            data = json.loads(content)
-        except json.JSONDecodeError:
-            continue
-
-        # Collect all schema objects to process
-        items_to_process: list[dict] = []
-
-        if isinstance(data, list):
-            items_to_process.extend(data)
-        elif isinstance(data, dict):
-            # Handle @graph arrays (common pattern in modern websites)
-            if "@graph" in data:
-                graph = data["@graph"]
-                if isinstance(graph, list):
-                    items_to_process.extend(graph)
-                elif isinstance(graph, dict):
-                    items_to_process.append(graph)
-            else:
-                items_to_process.append(data)
-
-        for item in items_to_process:
-            if not isinstance(item, dict):
-                continue
-
-            schema_type = _get_schema_type(item)
-
-            # Find and apply appropriate parser
-            parsed: dict = {}
-            primary_type = schema_type.split(",")[0].strip()
-            if primary_type in _SCHEMA_PARSERS:
-                parsed = _SCHEMA_PARSERS[primary_type](item)
-
-            schemas.append(SchemaInfo(type=schema_type, raw=item, parsed=parsed))
+        if content:
+            schemas.extend(_parse_json_ld(content))
 
     return schemas
 
 
-def extract_viewport(soup: BeautifulSoup) -> ViewportInfo:
-    """Extract viewport meta tag and check mobile-friendliness.
+def _build_viewport_info(content: str | None) -> ViewportInfo:
+    """Build ViewportInfo from a viewport meta value and check mobile-friendliness.
 
     Args:
-        soup: A BeautifulSoup object of the parsed HTML.
+        content: The content attribute, or None if the tag is missing.
 
     Returns:
         ViewportInfo with content, mobile-friendly status, and any issues.
     """
-    issues: list[str] = []
-    viewport_tag = soup.find("meta", attrs={"name": "viewport"})
-
-    if not viewport_tag:
-        return ViewportInfo(
-            content=None, is_mobile_friendly=False, issues=["Missing viewport meta tag"]
-        )
-
-    content = viewport_tag.get("content", "")
-    if isinstance(content, list):
-        content = content[0] if content else ""
-    content = content.strip()
+    content = content.strip() if content else ""
 
     if not content:
         return ViewportInfo(
             content=None, is_mobile_friendly=False, issues=["Missing viewport meta tag"]
         )
 
-    is_mobile_friendly = "width=device-width" in content
+    issues: Sequence[str] = _NO_ISSUES
+    is_mobile_friendly = VIEWPORT_DEVICE_WIDTH_PATTERN.search(content) is not None
 
     if not is_mobile_friendly:
-        issues.append("Viewport missing width=device-width")
+        issues = ["Viewport missing width=device-width"]
 
     return ViewportInfo(
         content=content, is_mobile_friendly=is_mobile_friendly, issues=issues
     )
 
 
+def extract_viewport(soup: BeautifulSoup) -> ViewportInfo:
+    """Extract viewport meta tag and check mobile-friendliness.
+
+    Args:
+        soup: A BeautifulSoup object of the parsed HTML.
+
+    Returns:
+        ViewportInfo with content, mobile-friendly status, and any issues.
+    """
+    viewport_tag = soup.find("meta", attrs={"name": "viewport"})
+
+    if not viewport_tag:
+        return _build_viewport_info(None)
+
+    return _build_viewport_info(viewport_tag.get("content") or "")
+
+
 def extract_hreflang(soup: BeautifulSoup) -> list[HreflangInfo]:
     """Extract hreflang link tags for internationalization.
 
@@ -946,16 +1296,8 @@ def extract_hreflang(soup: BeautifulSoup) -> list[HreflangInfo]:
     hreflang_tags = soup.find_all("link", rel="alternate", hreflang=True)
 
     for tag in hreflang_tags:
-        lang = tag.get("hreflang", "")
-        href = tag.get("href", "")
-
-        if isinstance(lang, list):
-            lang = lang[0] if lang else ""
-        if isinstance(href, list):
-            href = href[0] if href else ""
-
-        lang = lang.strip()
-        href = href.strip()
+        lang = (tag.get("hreflang") or "").strip()
+        href = (tag.get("href") or "").strip()
 
         if lang and href:
             hreflangs.append(HreflangInfo(lang=lang, url=href))
@@ -976,9 +1318,7 @@ def extract_localization(soup: BeautifulSoup) -> LocalizationInfo:
 
     html_lang: str | None = None
     if html_tag:
-        lang = html_tag.get("lang", "")
-        if isinstance(lang, list):
-            lang = lang[0] if lang else ""
+        lang = html_tag.get("lang") or ""
         html_lang = lang.strip() if lang.strip() else None
 
     return LocalizationInfo(
@@ -987,6 +1327,35 @@ def extract_localization(soup: BeautifulSoup) -> LocalizationInfo:
     )
 
 
+def _build_script_info(attrs: dict, content: str | None) -> ScriptInfo | None:
+    """Build ScriptInfo from a script tag's attributes and text.
+
+    Returns None for empty inline scripts, which are not reported.
+    """
+    src = attrs.get("src")
+    if src:
+        # External script
+        return ScriptInfo(
+            src=src.strip(),
+            is_inline=False,
+            inline_size=None,
+            has_async="async" in attrs,
+            has_defer="defer" in attrs,
+        )
+
+    # Inline script
+    content = (content or "").strip()
+    if not content:
+        return None
+    return ScriptInfo(
+        src=None,
+        is_inline=True,
+        inline_size=len(content),
+        has_async=False,
+        has_defer=False,
+    )
+
+
 def extract_scripts(soup: BeautifulSoup) -> list[ScriptInfo]:
     """Extract script information from the page.
 
@@ -998,107 +1367,135 @@ def extract_scripts(soup: BeautifulSoup) -> list[ScriptInfo]:
     """
     scripts: list[ScriptInfo] = []
 
-    script_tags = soup.find_all("script")
-
-    for tag in script_tags:
-        src = tag.get("src")
-        if isinstance(src, list):
-            src = src[0] if src else None
-
-        if src:
-            # External script
-            has_async = tag.has_attr("async")
-            has_defer = tag.has_attr("defer")
-            scripts.append(
-                ScriptInfo(
-                    src=src.strip(),
-                    is_inline=False,
-                    inline_size=None,
-                    has_async=has_async,
-                    has_defer=has_defer,
-                )
-            )
-        else:
-            # Inline script
-            content = tag.string or ""
-            content = content.strip()
-            if content:  # Skip empty inline scripts
-                scripts.append(
-                    ScriptInfo(
-                        src=None,
-                        is_inline=True,
-                        inline_size=len(content),
-                        has_async=False,
-                        has_defer=False,
-                    )
-                )
+    for tag in soup.find_all("script"):
+        # Read the attribute dict directly instead of going through the Tag
+        # accessors once per attribute
+        info = _build_script_info(tag.attrs, tag.string)
+        if info is not None:
+            scripts.append(info)
 
     return scripts
 
 
-def extract_faq_sections(soup: BeautifulSoup) -> list[FAQInfo]:
-    """Extract FAQ content from JSON-LD schema and HTML patterns.
+def extract_script_outline(
+    soup: BeautifulSoup,
+) -> tuple[list[ScriptInfo], list[SchemaInfo]]:
+    """Extract script info and JSON-LD structured data from a single script search.
+
+    Equivalent to calling extract_scripts and extract_structured_data, but the
+    JSON-LD blocks are picked out of the same script tags instead of searching
+    the tree a second time.
 
     Args:
         soup: A BeautifulSoup object of the parsed HTML.
 
     Returns:
-        List of FAQInfo with question, answer, and schema status.
+        Tuple of (ScriptInfo list, SchemaInfo list).
     """
-    faqs: list[FAQInfo] = []
-    seen_questions: set[str] = set()
-
-    # Source 1: JSON-LD FAQPage schema
-    ld_json_tags = soup.find_all("script", attrs={"type": "application/ld+json"})
+    scripts: list[ScriptInfo] = []
+    schemas: list[SchemaInfo] = []
 
-    for tag in ld_json_tags:
+    for tag in soup.find_all("script"):
+        attrs = tag.attrs
         content = tag.string
-        if not content:
-            continue
+        info = _build_script_info(attrs, content)
+        if info is not None:
+            scripts.append(info)
+        if content and attrs.get("type") == "application/ld+json":
+            schemas.extend(_parse_json_ld(content))
 
-        try:
-            data = json.loads(content)
-        except json.JSONDecodeError:
+    return scripts, schemas
+
+
+# Tags whose text is taken as the answer after a heading in an FAQ container
+_FAQ_ANSWER_TAGS = frozenset(("p", "div", "span"))
+
+
+def _add_faq(
+    faqs_by_key: dict[str, FAQInfo], question: str, answer: str, has_schema: bool
+) -> None:
+    """Add an FAQ unless one with the same question (ignoring case) was already found."""
+    question = question.strip()
+    key = question.lower()
+    if key not in faqs_by_key:
+        faqs_by_key[key] = FAQInfo(question=question, answer=answer.strip(), has_schema=has_schema)
+
+
+def _add_faq_page_items(faqs_by_key: dict[str, FAQInfo], items: Iterable[object]) -> None:
+    """Add the questions of any FAQPage among decoded JSON-LD schema objects."""
+    for item in items:
+        if not isinstance(item, dict):
             continue
 
-        items = data if isinstance(data, list) else [data]
+        schema_type = item.get("@type", "")
+        if type(schema_type) is list:
+            schema_type = schema_type[0] if schema_type else ""
+
+        if schema_type == "FAQPage":
+            main_entity = item.get("mainEntity", [])
+            if not isinstance(main_entity, list):
+                main_entity = [main_entity]
+
+            for entity in main_entity:
+                if not isinstance(entity, dict):
+                    continue
+                entity_type = entity.get("@type", "")
+                if entity_type == "Question":
+                    question = entity.get("name", "")
+                    accepted_answer = entity.get("acceptedAnswer", {})
+                    if isinstance(accepted_answer, dict):
+                        answer = accepted_answer.get("text", "")
+                    else:
+                        answer = ""
+
+                    if question and answer:
+                        _add_faq(faqs_by_key, question, answer, has_schema=True)
+
+
+def _add_schema_faqs(faqs_by_key: dict[str, FAQInfo], content: str) -> None:
+    """Add the questions of any FAQPage in one JSON-LD script body."""
+    # Only blocks naming an FAQPage type can contribute; skip decoding the
+    # rest (large Product/catalog graphs) without building their objects
+    if "FAQPage" not in content:
+        return
+
+    try:
+        data = _json_loads(str(content))
+    except ValueError:  # json.JSONDecodeError
+        return
+
+    # Same item walk as extract_structured_data, so FAQPage entries inside
+    # an @graph are found too
+    _add_faq_page_items(faqs_by_key, _iter_ld_items(data))
+
+
+def extract_faq_sections(
+    soup: BeautifulSoup, schemas: list[SchemaInfo] | None = None
+) -> list[FAQInfo]:
+    """Extract FAQ content from JSON-LD schema and HTML patterns.
 
-        for item in items:
-            if not isinstance(item, dict):
-                continue
+    Args:
+        soup: A BeautifulSoup object of the parsed HTML.
+        schemas: Result of extract_structured_data() for the same page, if
+                 already extracted; its decoded JSON-LD is reused instead of
+                 searching for and decoding the script tags again.
 
-            schema_type = item.get("@type", "")
-            if isinstance(schema_type, list):
-                schema_type = schema_type[0] if schema_type else ""
-
-            if schema_type == "FAQPage":
-                main_entity = item.get("mainEntity", [])
-                if not isinstance(main_entity, list):
-                    main_entity = [main_entity]
-
-                for entity in main_entity:
-                    if not isinstance(entity, dict):
-                        continue
-                    entity_type = entity.get("@type", "")
-                    if entity_type == "Question":
-                        question = entity.get("name", "")
-                        accepted_answer = entity.get("acceptedAnswer", {})
-                        if isinstance(accepted_answer, dict):
-                            answer = accepted_answer.get("text", "")
-                        else:
-                            answer = ""
-
-                        if question and answer:
-                            question_key = question.strip().lower()
-                            if question_key not in seen_questions:
-                                seen_questions.add(question_key)
-                                faqs.append(
-                                    FAQInfo(
-                                        question=question.strip(),
-                                        answer=answer.strip(),
-                                        has_schema=True,
-                                    )
-                                )
+    Returns:
+        List of FAQInfo with question, answer, and schema status.
+    """
+    # Keyed by normalized question text; dicts keep insertion order
+    faqs_by_key: dict[str, FAQInfo] = {}
+
+    # Source 1: JSON-LD FAQPage schema
+    if schemas is not None:
+        _add_faq_page_items(faqs_by_key, [schema.raw for schema in schemas])
+    else:
+        ld_json_tags = soup.find_all("script", attrs={"type": "application/ld+json"})
+
+        for tag in ld_json_tags:
+            content = tag.string
+            if content:
+                _add_schema_faqs(faqs_by_key, content)
 
     # Source 2: HTML patterns
 
@@ -1108,24 +1505,14 @@ def extract_faq_sections(soup: BeautifulSoup) -> list[FAQInfo]:
         summary = details.find("summary")
         if summary:
             question = summary.get_text(strip=True)
-            # Get answer: all text except summary
-            answer_parts = []
-            for child in details.children:
-                if child != summary and hasattr(child, "get_text"):
-                    answer_parts.append(child.get_text(strip=True))
-                elif child != summary and isinstance(child, str):
-                    text = child.strip()
-                    if text:
-                        answer_parts.append(text)
-            answer = " ".join(answer_parts).strip()
+            # Get answer: all text except summary. Children are compared to the
+            # summary by identity; Tag equality compares whole subtrees.
+            answer = " ".join(
+                child.get_text(strip=True) for child in details.children if child is not summary
+            ).strip()
 
             if question and answer:
-                question_key = question.strip().lower()
-                if question_key not in seen_questions:
-                    seen_questions.add(question_key)
-                    faqs.append(
-                        FAQInfo(question=question, answer=answer, has_schema=False)
-                    )
+                _add_faq(faqs_by_key, question, answer, has_schema=False)
 
     # Pattern 2b: <dt>Question</dt><dd>Answer</dd>
     dt_tags = soup.find_all("dt")
@@ -1135,39 +1522,37 @@ def extract_faq_sections(soup: BeautifulSoup) -> list[FAQInfo]:
         if dd:
             answer = dd.get_text(strip=True)
             if question and answer:
-                question_key = question.strip().lower()
-                if question_key not in seen_questions:
-                    seen_questions.add(question_key)
-                    faqs.append(
-                        FAQInfo(question=question, answer=answer, has_schema=False)
-                    )
-
-    # Pattern 2c: Elements with class/id containing "faq"
-    faq_containers = soup.find_all(
-        lambda tag: tag.get("class")
-        and any("faq" in c.lower() for c in tag.get("class", []))
-        or tag.get("id")
-        and "faq" in tag.get("id", "").lower()
-    )
+                _add_faq(faqs_by_key, question, answer, has_schema=False)
+
+    # Pattern 2c: Elements with class/id containing "faq". Tags are scanned in
+    # one plain loop; a find_all() predicate or soup.select() (soupsieve) pays
+    # per-tag callback/matcher overhead and measured 3-12x slower.
+    faq_containers = []
+    for tag in soup.find_all(True):
+        attrs = tag.attrs
+        if not attrs:
+            continue
+        classes = attrs.get("class")
+        tag_id = attrs.get("id")
+        if (classes and "faq" in " ".join(classes).lower()) or (tag_id and "faq" in tag_id.lower()):
+            faq_containers.append(tag)
 
     for container in faq_containers:
         # Look for heading + content pairs within FAQ containers
         headings = container.find_all(["h2", "h3", "h4", "h5", "h6"])
         for heading in headings:
             question = heading.get_text(strip=True)
+            if not question:
+                # Empty headings can't be questions; skip the sibling lookup
+                continue
             # Get next sibling that contains answer content
             next_elem = heading.find_next_sibling()
-            if next_elem and next_elem.name in ["p", "div", "span"]:
+            if next_elem and next_elem.name in _FAQ_ANSWER_TAGS:
                 answer = next_elem.get_text(strip=True)
-                if question and answer:
-                    question_key = question.strip().lower()
-                    if question_key not in seen_questions:
-                        seen_questions.add(question_key)
-                        faqs.append(
-                            FAQInfo(question=question, answer=answer, has_schema=False)
-                        )
+                if answer:
+                    _add_faq(faqs_by_key, question, answer, has_schema=False)
 
-    return faqs
+    return list(faqs_by_key.values())
 
 
 # Common stop words for keyword extraction
@@ -1289,6 +1674,56 @@ STOP_WORDS = frozenset(
     }
 )
 
+# Byte translation table for keyword tokenizing: keeps a-z and 0-9, lowercases
+# A-Z and maps every other byte to a space, so translate() + split() yields the
+# [a-z0-9]+ runs of the lowercased ASCII text
+_KEYWORD_CHARS = b"abcdefghijklmnopqrstuvwxyz0123456789"
+_KEYWORD_TOKEN_TABLE = bytes(
+    byte if byte in _KEYWORD_CHARS else byte + 32 if 65 <= byte <= 90 else 0x20
+    for byte in range(256)
+)
+
+# The only non-ASCII characters whose lowercase form contains ASCII letters
+# (U+0130 capital I with dot above -> "i" + combining dot, U+212A Kelvin sign
+# -> "k"); text containing them is lowercased as a whole before tokenizing
+_ASCII_LOWERING_CHARS = ("\u0130", "\u212a")
+
+# Terms left out of the keyword counts: stop words plus every one-character
+# token the tokenizer can produce, so a single set lookup covers both rules
+_EXCLUDED_KEYWORDS = STOP_WORDS | frozenset(_KEYWORD_CHARS.decode("ascii"))
+
+
+def _build_keywords_info(text: str) -> KeywordsInfo:
+    """Tokenize visible page text and count the most frequent terms.
+
+    Args:
+        text: The visible text of the page body.
+
+    Returns:
+        KeywordsInfo with top 20 terms and total word count.
+    """
+    # Tokenize: lowercase, alphanumeric only. Non-ASCII characters become "?"
+    # and then separators, so one C-level translate + split replaces a regex scan.
+    # The table lowercases A-Z, so the text is only copied by lower() when a
+    # non-ASCII character would lowercase into a token.
+    if any(char in text for char in _ASCII_LOWERING_CHARS):
+        text = text.lower()
+    words = text.encode("ascii", "replace").translate(_KEYWORD_TOKEN_TABLE).decode("ascii").split()
+
+    total_words = len(words)
+
+    # Count frequencies, then drop stop words and single characters from the
+    # distinct terms rather than filtering every token into a second list
+    word_counts = Counter(words)
+    for word in _EXCLUDED_KEYWORDS.intersection(word_counts):
+        del word_counts[word]
+
+    # Get top 20 terms
+    top_20 = word_counts.most_common(20)
+    top_terms = [KeywordTerm(term=term, count=count) for term, count in top_20]
+
+    return KeywordsInfo(top_terms=top_terms, total_words=total_words)
+
 
 def extract_keywords(soup: BeautifulSoup) -> KeywordsInfo:
     """Extract and analyze keywords from page visible text.
@@ -1309,21 +1744,201 @@ def extract_keywords(soup: BeautifulSoup) -> KeywordsInfo:
         tag.decompose()
 
     # Get visible text
-    text = body.get_text(separator=" ", strip=True)
+    return _build_keywords_info(body.get_text(separator=" ", strip=True))
 
-    # Tokenize: lowercase, alphanumeric only
-    words = re.findall(r"[a-z0-9]+", text.lower())
 
-    total_words = len(words)
+# Text nodes of an element, skipping comments and anything inside <script>,
+# <style>, <template>, <rt> or <rp>, as BeautifulSoup's get_text() does (it
+# types those strings as Script, Stylesheet, TemplateString and ruby strings)
+_VISIBLE_TEXT_XPATH = etree.XPath(
+    "descendant-or-self::text()[not(ancestor::script or ancestor::style"
+    " or ancestor::template or ancestor::rt or ancestor::rp)]",
+    smart_strings=False,
+)
 
-    # Filter out stop words
-    filtered_words = [w for w in words if w not in STOP_WORDS and len(w) > 1]
 
-    # Count frequencies
-    word_counts = Counter(filtered_words)
+@dataclass(slots=True)
+class _DocumentElements:
+    """Raw values gathered by the single DOM walk in extract_document_seo()."""
 
-    # Get top 20 terms
-    top_20 = word_counts.most_common(20)
-    top_terms = [KeywordTerm(term=term, count=count) for term, count in top_20]
+    title: str | None = None
+    # An empty first <title> has no text; later <title>s (e.g. inside an
+    # inline SVG) must still not replace it
+    title_seen: bool = False
+    description: str | None = None
+    robots: str | None = None
+    viewport: str | None = None
+    canonical: str | None = None
+    html_lang: str | None = None
+    headings: list[HeadingItem] = field(default_factory=list)
+    og_tags: dict[str, str] = field(default_factory=dict)
+    twitter_by_name: dict[str, str] = field(default_factory=dict)
+    twitter_by_property: dict[str, str] = field(default_factory=dict)
+    ld_json: list[str] = field(default_factory=list)
+    hreflangs: list[HreflangInfo] = field(default_factory=list)
+
+
+def _collect_title(element: etree._Element, found: _DocumentElements) -> None:
+    """Keep the text of the first <title>."""
+    if not found.title_seen:
+        found.title_seen = True
+        found.title = element.text
+
+
+def _collect_meta(element: etree._Element, found: _DocumentElements) -> None:
+    """Route a <meta> tag by its name or property attribute."""
+    name = element.get("name")
+    prop = element.get("property")
+    content = element.get("content") or ""
+
+    if name == "description":
+        if found.description is None:
+            found.description = content
+    elif name == "robots":
+        if found.robots is None:
+            found.robots = content
+    elif name == "viewport":
+        if found.viewport is None:
+            found.viewport = content
+    elif name and name.startswith("twitter:") and content:
+        found.twitter_by_name[name[8:]] = content
+
+    if prop and content:
+        prefix, colon, key = prop.partition(":")
+        if colon:
+            if prefix == "og":
+                found.og_tags[key] = content
+            elif prefix == "twitter":
+                found.twitter_by_property[key] = content
+
+
+def _collect_link(element: etree._Element, found: _DocumentElements) -> None:
+    """Record the first canonical link and any hreflang alternates."""
+    rel = (element.get("rel") or "").split()
+    if "canonical" in rel and found.canonical is None:
+        found.canonical = element.get("href") or ""
+    if "alternate" in rel and element.get("hreflang") is not None:
+        lang = element.get("hreflang").strip()
+        href = (element.get("href") or "").strip()
+        if lang and href:
+            found.hreflangs.append(HreflangInfo(lang=lang, url=href))
 
-    return KeywordsInfo(top_terms=top_terms, total_words=total_words)
+
+def _collect_heading(element: etree._Element, found: _DocumentElements) -> None:
+    """Record an h1-h4 heading with its visible text."""
+    tag = element.tag
+    text = "".join(text.strip() for text in _VISIBLE_TEXT_XPATH(element))
+    found.headings.append(HeadingItem(tag=tag, text=text, level=_LEVEL_MAP[tag]))
+
+
+def _collect_script(element: etree._Element, found: _DocumentElements) -> None:
+    """Keep the body of a JSON-LD script."""
+    if element.get("type") == "application/ld+json" and element.text:
+        found.ld_json.append(element.text)
+
+
+def _collect_html(element: etree._Element, found: _DocumentElements) -> None:
+    """Keep the lang attribute of the <html> element."""
+    if found.html_lang is None:
+        found.html_lang = element.get("lang") or ""
+
+
+# Collector for each tag name visited by extract_document_seo()
+_ELEMENT_COLLECTORS = {
+    "title": _collect_title,
+    "meta": _collect_meta,
+    "link": _collect_link,
+    "script": _collect_script,
+    "html": _collect_html,
+    **dict.fromkeys(_LEVEL_MAP, _collect_heading),
+}
+
+
+def extract_document_seo(root: etree._Element, page_url: str) -> DocumentSEOInfo:
+    """Extract head, heading and JSON-LD elements in a single walk of an lxml tree.
+
+    Visits every element once and hands the relevant ones to a per-tag
+    collector, instead of one tree search per extractor. Applies the same rules
+    as extract_title, extract_all_meta, extract_canonical,
+    extract_heading_outline, extract_structured_data, extract_viewport,
+    extract_hreflang and extract_localization.
+
+    Args:
+        root: Root element of an lxml.html tree, e.g. from
+              lxml.html.document_fromstring().
+        page_url: The URL of the current page for self-referencing check.
+
+    Returns:
+        DocumentSEOInfo with all head, heading and JSON-LD information.
+    """
+    found = _DocumentElements()
+    collectors = _ELEMENT_COLLECTORS
+    for element in root.iter():
+        collect = collectors.get(element.tag)
+        if collect is not None:
+            collect(element, found)
+
+    h1_texts = [heading.text for heading in found.headings if heading.level == 1]
+    schemas: list[SchemaInfo] = []
+    for content in found.ld_json:
+        schemas.extend(_parse_json_ld(content))
+    html_lang = (found.html_lang or "").strip()
+
+    return DocumentSEOInfo(
+        title=_build_title_info(found.title),
+        meta_description=_build_meta_description_info(found.description),
+        canonical=_build_canonical_info(found.canonical, page_url),
+        robots=_build_robots_info(found.robots),
+        h1=_build_h1_info(h1_texts[0] if h1_texts else "", len(h1_texts)),
+        headings_hierarchy=_build_headings_hierarchy(found.headings),
+        open_graph=_build_open_graph_info(found.og_tags),
+        # Property-based Twitter tags take precedence, as in extract_twitter_card
+        twitter_card=_build_twitter_card_info(
+            {**found.twitter_by_name, **found.twitter_by_property}
+        ),
+        schemas=schemas,
+        viewport=_build_viewport_info(found.viewport),
+        hreflangs=found.hreflangs,
+        localization=LocalizationInfo(
+            html_lang=html_lang if html_lang else None,
+            content_language=None,  # Comes from HTTP headers, not HTML
+        ),
+    )
+
+
+def extract_page_seo(html: str | bytes, page_url: str) -> PageSEOData:
+    """Parse a page and run every page-level extractor on it.
+
+    Builds one soup and shares it, along with the combined meta, heading and
+    script results, across every extractor.
+
+    Args:
+        html: The raw HTML content of the page.
+        page_url: The URL of the page for the canonical self-reference check.
+
+    Returns:
+        PageSEOData with all page-level SEO elements.
+    """
+    soup = parse_html(html)
+    meta_tags = extract_all_meta(soup)
+    h1, headings = extract_heading_outline(soup)
+    scripts, schemas = extract_script_outline(soup)
+
+    return PageSEOData(
+        title=extract_title(soup),
+        meta_description=meta_tags.description,
+        canonical=extract_canonical(soup, page_url),
+        robots=meta_tags.robots,
+        h1=h1,
+        headings_hierarchy=headings,
+        open_graph=meta_tags.open_graph,
+        twitter_card=meta_tags.twitter_card,
+        schemas=schemas,
+        viewport=meta_tags.viewport,
+        hreflangs=extract_hreflang(soup),
+        localization=extract_localization(soup),
+        scripts=scripts,
+        faqs=extract_faq_sections(soup, schemas),
+        # Last: removes script/style/noscript tags from the soup
+        keywords=extract_keywords(soup),
+    )
@@ -0,0 +1,526 @@
+"""SEO extractors backed by selectolax's Lexbor HTML parser.
+
+Alternative to the BeautifulSoup extractors in utils_seo for the head,
+heading, JSON-LD, script, FAQ and keyword extractors. Lexbor parses and runs CSS selectors in C,
+which is considerably faster than building and searching a BeautifulSoup tree.
+Results use the same models and issue rules as utils_seo.
+
+selectolax is an optional dependency: check SELECTOLAX_AVAILABLE before use.
+"""
+
+from models_seo import (
+    CanonicalInfo,
+    FAQInfo,
+    HeadingInfo,
+    HeadingItem,
+    HeadingsHierarchy,
+    HreflangInfo,
+    KeywordsInfo,
+    LocalizationInfo,
+    MetaInfo,
+    MetaTagsInfo,
+    OpenGraphInfo,
+    RobotsInfo,
+    SchemaInfo,
+    ScriptInfo,
+    TitleInfo,
+    TwitterCardInfo,
+    ViewportInfo,
+)
+from utils_seo import (
+    _FAQ_ANSWER_TAGS,
+    _LEVEL_MAP,
+    _add_faq,
+    _add_faq_page_items,
+    _add_schema_faqs,
+    _build_canonical_info,
+    _build_h1_info,
+    _build_headings_hierarchy,
+    _build_keywords_info,
+    _build_meta_description_info,
+    _build_open_graph_info,
+    _build_robots_info,
+    _build_script_info,
+    _build_title_info,
+    _build_twitter_card_info,
+    _build_viewport_info,
+    _parse_json_ld,
+)
+
+try:
+    from selectolax.lexbor import LexborHTMLParser, LexborNode
+except ImportError:
+    LexborHTMLParser = LexborNode = None
+
+SELECTOLAX_AVAILABLE = LexborHTMLParser is not None
+
+
+def parse_html(html: str | bytes) -> "LexborHTMLParser":
+    """Parse an HTML document with Lexbor.
+
+    Args:
+        html: The raw HTML content.
+
+    Returns:
+        The parsed LexborHTMLParser tree.
+
+    Raises:
+        ImportError: If selectolax is not installed.
+    """
+    if not SELECTOLAX_AVAILABLE:
+        raise ImportError("selectolax is required for utils_seo_selectolax")
+    return LexborHTMLParser(html)
+
+
+def _meta_content(tree: "LexborHTMLParser", name: str) -> str | None:
+    """Get the content of the first <meta name="..."> tag, or None if missing."""
+    node = tree.css_first(f'meta[name="{name}"]')
+    if node is None:
+        return None
+    return node.attributes.get("content") or ""
+
+
+# Lexbor matches the type attribute case-insensitively by default; the "s"
+# flag makes it exact, as bs4's attrs={"type": ...} match is
+_LD_JSON_SELECTOR = 'script[type="application/ld+json" s]'
+
+# Tags whose text bs4's get_text() leaves out (its Script, Stylesheet,
+# TemplateString and ruby annotation string types). Template contents sit in a
+# separate fragment in Lexbor, so node.text() already skips them.
+_HIDDEN_TEXT_TAGS = frozenset(("script", "style", "template", "rt", "rp"))
+_HIDDEN_TEXT_SELECTOR = "script, style, rt, rp"
+
+
+def _collect_visible_text(node: "LexborNode", parts: list[str]) -> None:
+    """Append the stripped, non-empty text nodes under node, skipping hidden tags."""
+    for child in node.iter(include_text=True):
+        tag = child.tag
+        if tag == "-text":
+            text = child.text(deep=False).strip()
+            if text:
+                parts.append(text)
+        elif child.is_element_node and tag not in _HIDDEN_TEXT_TAGS:
+            _collect_visible_text(child, parts)
+
+
+def _visible_text(node: "LexborNode") -> str:
+    """Get a node's text by the same rules as bs4's get_text(strip=True).
+
+    Hidden tags are only skipped below the node; like bs4, a <script> or <rt>
+    asked for its own text returns it.
+    """
+    # Common case: nothing to skip, so let Lexbor join the text in C
+    if (
+        not node.is_element_node
+        or node.tag in _HIDDEN_TEXT_TAGS
+        or node.css_first(_HIDDEN_TEXT_SELECTOR) is None
+    ):
+        return node.text(strip=True)
+    parts: list[str] = []
+    _collect_visible_text(node, parts)
+    return "".join(parts)
+
+
+def extract_title(tree: "LexborHTMLParser") -> TitleInfo:
+    """Extract the page title tag and analyze it for SEO issues.
+
+    Args:
+        tree: A parsed LexborHTMLParser tree.
+
+    Returns:
+        TitleInfo with the title text, length, and any SEO issues.
+    """
+    node = tree.css_first("title")
+    return _build_title_info(node.text() if node is not None else None)
+
+
+def extract_meta_description(tree: "LexborHTMLParser") -> MetaInfo:
+    """Extract the meta description tag and analyze it for SEO issues.
+
+    Args:
+        tree: A parsed LexborHTMLParser tree.
+
+    Returns:
+        MetaInfo with the description text, length, and any SEO issues.
+    """
+    return _build_meta_description_info(_meta_content(tree, "description"))
+
+
+def extract_canonical(tree: "LexborHTMLParser", page_url: str) -> CanonicalInfo:
+    """Extract the canonical link tag and analyze it for SEO issues.
+
+    Args:
+        tree: A parsed LexborHTMLParser tree.
+        page_url: The URL of the current page for self-referencing check.
+
+    Returns:
+        CanonicalInfo with the canonical URL, self-reference status, and any issues.
+    """
+    node = tree.css_first('link[rel~="canonical" s]')
+    href = node.attributes.get("href") if node is not None else None
+    return _build_canonical_info(href, page_url)
+
+
+def extract_robots_meta(tree: "LexborHTMLParser") -> RobotsInfo:
+    """Extract the robots meta tag and determine indexability.
+
+    Args:
+        tree: A parsed LexborHTMLParser tree.
+
+    Returns:
+        RobotsInfo with robots directives, indexability status, and any issues.
+    """
+    return _build_robots_info(_meta_content(tree, "robots"))
+
+
+def extract_h1(tree: "LexborHTMLParser") -> HeadingInfo:
+    """Extract H1 heading tags and analyze them for SEO issues.
+
+    Args:
+        tree: A parsed LexborHTMLParser tree.
+
+    Returns:
+        HeadingInfo with the first H1 text, count of all H1s, and any issues.
+    """
+    h1_nodes = tree.css("h1")
+    if not h1_nodes:
+        return _build_h1_info("", 0)
+    return _build_h1_info(_visible_text(h1_nodes[0]), len(h1_nodes))
+
+
+def extract_headings(tree: "LexborHTMLParser") -> HeadingsHierarchy:
+    """Extract all headings and validate hierarchy for SEO issues.
+
+    Args:
+        tree: A parsed LexborHTMLParser tree.
+
+    Returns:
+        HeadingsHierarchy with all headings and any hierarchy issues.
+    """
+    headings = [
+        HeadingItem(tag=node.tag, text=_visible_text(node), level=_LEVEL_MAP[node.tag])
+        for node in tree.css("h1, h2, h3, h4")
+    ]
+    return _build_headings_hierarchy(headings)
+
+
+def extract_heading_outline(
+    tree: "LexborHTMLParser",
+) -> tuple[HeadingInfo, HeadingsHierarchy]:
+    """Extract H1 info and the heading hierarchy from a single heading query.
+
+    Args:
+        tree: A parsed LexborHTMLParser tree.
+
+    Returns:
+        Tuple of (HeadingInfo for H1 tags, HeadingsHierarchy for h1-h4).
+    """
+    hierarchy = extract_headings(tree)
+    h1_texts = [heading.text for heading in hierarchy.headings if heading.level == 1]
+    h1 = _build_h1_info(h1_texts[0] if h1_texts else "", len(h1_texts))
+    return h1, hierarchy
+
+
+def extract_open_graph(tree: "LexborHTMLParser") -> OpenGraphInfo:
+    """Extract Open Graph meta tags for social sharing.
+
+    Args:
+        tree: A parsed LexborHTMLParser tree.
+
+    Returns:
+        OpenGraphInfo with extracted OG properties.
+    """
+    all_tags: dict[str, str] = {}
+    for node in tree.css('meta[property^="og:"]'):
+        content = node.attributes.get("content")
+        if content:
+            all_tags[node.attributes["property"][3:]] = content
+    return _build_open_graph_info(all_tags)
+
+
+def extract_twitter_card(tree: "LexborHTMLParser") -> TwitterCardInfo:
+    """Extract Twitter Card meta tags for social sharing.
+
+    Args:
+        tree: A parsed LexborHTMLParser tree.
+
+    Returns:
+        TwitterCardInfo with extracted Twitter Card properties.
+    """
+    all_tags: dict[str, str] = {}
+    # Twitter cards can use either name or property attribute; property wins
+    for attr in ("name", "property"):
+        for node in tree.css(f'meta[{attr}^="twitter:"]'):
+            content = node.attributes.get("content")
+            if content:
+                all_tags[node.attributes[attr][8:]] = content
+    return _build_twitter_card_info(all_tags)
+
+
+# One selector group for every meta tag extract_all_meta routes, so Lexbor
+# walks the tree once and returns the matches in document order
+_META_BUNDLE_SELECTOR = (
+    'meta[name="description"], meta[name="robots"], meta[name="viewport"], '
+    'meta[name^="twitter:"], meta[property^="og:"], meta[property^="twitter:"]'
+)
+
+
+def extract_all_meta(tree: "LexborHTMLParser") -> MetaTagsInfo:
+    """Extract meta description, robots, viewport, Open Graph and Twitter Card tags at once.
+
+    Runs a single combined selector instead of one query per extractor.
+    Results match utils_seo.extract_all_meta.
+
+    Args:
+        tree: A parsed LexborHTMLParser tree.
+
+    Returns:
+        MetaTagsInfo bundling MetaInfo, RobotsInfo, OpenGraphInfo, TwitterCardInfo
+        and ViewportInfo.
+    """
+    description: str | None = None
+    robots: str | None = None
+    viewport: str | None = None
+    og_tags: dict[str, str] = {}
+    twitter_by_name: dict[str, str] = {}
+    twitter_by_property: dict[str, str] = {}
+
+    for node in tree.css(_META_BUNDLE_SELECTOR):
+        attrs = node.attributes
+        name = attrs.get("name")
+        prop = attrs.get("property")
+        content = attrs.get("content") or ""
+
+        if name == "description":
+            if description is None:
+                description = content
+        elif name == "robots":
+            if robots is None:
+                robots = content
+        elif name == "viewport":
+            if viewport is None:
+                viewport = content
+        elif name and name.startswith("twitter:") and content:
+            twitter_by_name[name[8:]] = content
+
+        if prop and content:
+            prefix, colon, key = prop.partition(":")
+            if colon:
+                if prefix == "og":
+                    og_tags[key] = content
+                elif prefix == "twitter":
+                    twitter_by_property[key] = content
+
+    return MetaTagsInfo(
+        description=_build_meta_description_info(description),
+        robots=_build_robots_info(robots),
+        open_graph=_build_open_graph_info(og_tags),
+        # Property-based Twitter tags take precedence, as in extract_twitter_card
+        twitter_card=_build_twitter_card_info({**twitter_by_name, **twitter_by_property}),
+        viewport=_build_viewport_info(viewport),
+    )
+
+
+def extract_structured_data(tree: "LexborHTMLParser") -> list[SchemaInfo]:
+    """Extract JSON-LD structured data from the page.
+
+    Args:
+        tree: A parsed LexborHTMLParser tree.
+
+    Returns:
+        List of SchemaInfo with type, raw data, and parsed fields.
+    """
+    schemas: list[SchemaInfo] = []
+    for node in tree.css(_LD_JSON_SELECTOR):
+        content = node.text()
+        if content:
+            schemas.extend(_parse_json_ld(content))
+    return schemas
+
+
+def extract_viewport(tree: "LexborHTMLParser") -> ViewportInfo:
+    """Extract viewport meta tag and check mobile-friendliness.
+
+    Args:
+        tree: A parsed LexborHTMLParser tree.
+
+    Returns:
+        ViewportInfo with content, mobile-friendly status, and any issues.
+    """
+    return _build_viewport_info(_meta_content(tree, "viewport"))
+
+
+def extract_hreflang(tree: "LexborHTMLParser") -> list[HreflangInfo]:
+    """Extract hreflang link tags for internationalization.
+
+    Args:
+        tree: A parsed LexborHTMLParser tree.
+
+    Returns:
+        List of HreflangInfo with language and URL for each tag.
+    """
+    hreflangs: list[HreflangInfo] = []
+    for node in tree.css('link[rel~="alternate" s][hreflang]'):
+        lang = (node.attributes.get("hreflang") or "").strip()
+        href = (node.attributes.get("href") or "").strip()
+        if lang and href:
+            hreflangs.append(HreflangInfo(lang=lang, url=href))
+    return hreflangs
+
+
+def extract_localization(tree: "LexborHTMLParser") -> LocalizationInfo:
+    """Extract page localization information.
+
+    Args:
+        tree: A parsed LexborHTMLParser tree.
+
+    Returns:
+        LocalizationInfo with HTML lang attribute and content-language header value.
+    """
+    node = tree.css_first("html")
+    lang = (node.attributes.get("lang") or "").strip() if node is not None else ""
+    return LocalizationInfo(
+        html_lang=lang if lang else None,
+        content_language=None,  # Comes from HTTP headers, not HTML
+    )
+
+
+def extract_scripts(tree: "LexborHTMLParser") -> list[ScriptInfo]:
+    """Extract script information from the page.
+
+    Args:
+        tree: A parsed LexborHTMLParser tree.
+
+    Returns:
+        List of ScriptInfo with src, async/defer attributes, and inline details.
+    """
+    scripts: list[ScriptInfo] = []
+    for node in tree.css("script"):
+        info = _build_script_info(node.attributes, node.text())
+        if info is not None:
+            scripts.append(info)
+    return scripts
+
+
+def extract_script_outline(
+    tree: "LexborHTMLParser",
+) -> tuple[list[ScriptInfo], list[SchemaInfo]]:
+    """Extract script info and JSON-LD structured data from a single script search.
+
+    Args:
+        tree: A parsed LexborHTMLParser tree.
+
+    Returns:
+        Tuple of (ScriptInfo list, SchemaInfo list).
+    """
+    scripts: list[ScriptInfo] = []
+    schemas: list[SchemaInfo] = []
+    for node in tree.css("script"):
+        attrs = node.attributes
+        content = node.text()
+        info = _build_script_info(attrs, content)
+        if info is not None:
+            scripts.append(info)
+        if content and attrs.get("type") == "application/ld+json":
+            schemas.extend(_parse_json_ld(content))
+    return scripts, schemas
+
+
+def _next_element(node: "LexborNode") -> "LexborNode | None":
+    """Get the next sibling element of a node, skipping text and comment nodes."""
+    node = node.next
+    while node is not None and not node.is_element_node:
+        node = node.next
+    return node
+
+
+def extract_faq_sections(
+    tree: "LexborHTMLParser", schemas: list[SchemaInfo] | None = None
+) -> list[FAQInfo]:
+    """Extract FAQ content from JSON-LD schema and HTML patterns.
+
+    Args:
+        tree: A parsed LexborHTMLParser tree.
+        schemas: Result of extract_structured_data() for the same page, if
+                 already extracted; its decoded JSON-LD is reused.
+
+    Returns:
+        List of FAQInfo with question, answer, and schema status.
+    """
+    # Keyed by normalized question text; dicts keep insertion order
+    faqs_by_key: dict[str, FAQInfo] = {}
+
+    # Source 1: JSON-LD FAQPage schema
+    if schemas is not None:
+        _add_faq_page_items(faqs_by_key, [schema.raw for schema in schemas])
+    else:
+        for node in tree.css(_LD_JSON_SELECTOR):
+            content = node.text()
+            if content:
+                _add_schema_faqs(faqs_by_key, content)
+
+    # Pattern 2a: <details><summary>Question</summary>Answer</details>
+    for details in tree.css("details"):
+        summary = details.css_first("summary")
+        if summary is not None:
+            question = _visible_text(summary)
+            # Get answer: text of every child node except the summary. Nodes
+            # are matched by mem_id; LexborNode equality compares serialized HTML.
+            summary_id = summary.mem_id
+            answer = " ".join(
+                _visible_text(child)
+                for child in details.iter(include_text=True)
+                if child.mem_id != summary_id
+            ).strip()
+
+            if question and answer:
+                _add_faq(faqs_by_key, question, answer, has_schema=False)
+
+    # Pattern 2b: <dt>Question</dt><dd>Answer</dd>
+    for dt in tree.css("dt"):
+        question = _visible_text(dt)
+        dd = _next_element(dt)
+        while dd is not None and dd.tag != "dd":
+            dd = _next_element(dd)
+        if dd is not None:
+            answer = _visible_text(dd)
+            if question and answer:
+                _add_faq(faqs_by_key, question, answer, has_schema=False)
+
+    # Pattern 2c: Elements with class/id containing "faq" (matched in C)
+    for container in tree.css('[class*="faq" i], [id*="faq" i]'):
+        # Look for heading + content pairs within FAQ containers (css() also
+        # matches the container itself, which find_all() in utils_seo doesn't)
+        container_id = container.mem_id
+        for heading in container.css("h2, h3, h4, h5, h6"):
+            if heading.mem_id == container_id:
+                continue
+            question = _visible_text(heading)
+            if not question:
+                continue
+            # Get next sibling that contains answer content
+            next_elem = _next_element(heading)
+            if next_elem is not None and next_elem.tag in _FAQ_ANSWER_TAGS:
+                answer = _visible_text(next_elem)
+                if answer:
+                    _add_faq(faqs_by_key, question, answer, has_schema=False)
+
+    return list(faqs_by_key.values())
+
+
+def extract_keywords(tree: "LexborHTMLParser") -> KeywordsInfo:
+    """Extract and analyze keywords from page visible text.
+
+    Removes script, style and noscript nodes from the tree, so run it after
+    any extractor that needs them (e.g. extract_scripts).
+
+    Args:
+        tree: A parsed LexborHTMLParser tree.
+
+    Returns:
+        KeywordsInfo with top 20 terms and total word count.
+    """
+    # One C call removes every matching node, instead of a decompose() per node
+    tree.strip_tags(["script", "style", "noscript"])
+    body = tree.body if tree.body is not None else tree.root
+    return _build_keywords_info(body.text(separator=" ", strip=True))
@@ -1,12 +1,18 @@
 """Utility functions for Wayback Machine (web.archive.org) interactions."""
 
-from collections import defaultdict
+import asyncio
 from dataclasses import dataclass
 from datetime import datetime
+from operator import attrgetter
 from typing import Literal
 
 import httpx
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 CDX_API_URL = "http://web.archive.org/cdx/search/cdx"
 
 FrequencyType = Literal["daily", "weekly", "monthly"]
@@ -54,7 +60,18 @@ def parse_wayback_timestamp(timestamp: str) -> datetime:
     Raises:
         ValueError: If the timestamp format is invalid.
     """
-    return datetime.strptime(timestamp, "%Y%m%d%H%M%S")
+    # Fixed-width digits, so slice the fields directly; strptime re-parses the
+    # format string on every call and CDX lookups return thousands of rows
+    if len(timestamp) != 14 or not (timestamp.isascii() and timestamp.isdigit()):
+        raise ValueError(f"Invalid Wayback timestamp: {timestamp!r}")
+    return datetime(
+        int(timestamp[:4]),
+        int(timestamp[4:6]),
+        int(timestamp[6:8]),
+        int(timestamp[8:10]),
+        int(timestamp[10:12]),
+        int(timestamp[12:14]),
+    )
 
 
 def format_snapshot_filename(timestamp: str) -> str:
@@ -104,43 +121,37 @@ async def fetch_cdx_snapshots(
     response = await client.get(CDX_API_URL, params=params)
     response.raise_for_status()
 
-    data = response.json()
+    # CDX responses for busy URLs run to megabytes; decode the raw bytes with
+    # orjson when available instead of httpx's stdlib json.loads
+    data = _json_loads(response.content)
 
     if not data or len(data) <= 1:
         return []
 
-    snapshots: list[WaybackSnapshot] = []
-    for row in data[1:]:
-        timestamp, original, statuscode, digest = row
-        snapshots.append(
-            WaybackSnapshot(
-                timestamp=timestamp,
-                original_url=original,
-                status_code=statuscode,
-                digest=digest,
-                datetime=parse_wayback_timestamp(timestamp),
-            )
+    # First row is the field header
+    snapshots = [
+        WaybackSnapshot(
+            timestamp=timestamp,
+            original_url=original,
+            status_code=statuscode,
+            digest=digest,
+            datetime=parse_wayback_timestamp(timestamp),
         )
+        for timestamp, original, statuscode, digest in data[1:]
+    ]
 
-    return sorted(snapshots, key=lambda s: s.datetime)
-
+    # CDX usually returns rows in order, but callers rely on the guarantee;
+    # fixed-width timestamps sort chronologically as plain strings
+    snapshots.sort(key=attrgetter("timestamp"))
+    return snapshots
 
-def _get_period_key(dt: datetime, frequency: FrequencyType) -> str:
-    """Generate a grouping key for a datetime based on frequency.
 
-    Args:
-        dt: The datetime to generate a key for.
-        frequency: The grouping frequency (daily, weekly, monthly).
-
-    Returns:
-        A string key that groups datetimes by the specified period.
-    """
-    if frequency == "daily":
-        return dt.strftime("%Y-%m-%d")
-    elif frequency == "weekly":
-        return dt.strftime("%Y-W%W")
-    else:
-        return dt.strftime("%Y-%m")
+# strftime format per frequency; snapshots sharing a formatted key share a period
+_PERIOD_FORMATS: dict[str, str] = {
+    "daily": "%Y-%m-%d",
+    "weekly": "%Y-W%W",
+    "monthly": "%Y-%m",
+}
 
 
 def filter_snapshots_by_frequency(
@@ -153,7 +164,7 @@ def filter_snapshots_by_frequency(
     selects the snapshot closest to the middle of each period.
 
     Args:
-        snapshots: List of WaybackSnapshot objects (should be sorted by date).
+        snapshots: List of WaybackSnapshot objects (must be sorted by date).
         frequency: The desired frequency - "daily", "weekly", or "monthly".
 
     Returns:
@@ -162,22 +173,22 @@ def filter_snapshots_by_frequency(
     if not snapshots:
         return []
 
-    grouped: dict[str, list[WaybackSnapshot]] = defaultdict(list)
-
-    for snapshot in snapshots:
-        key = _get_period_key(snapshot.datetime, frequency)
-        grouped[key].append(snapshot)
-
+    period_format = _PERIOD_FORMATS.get(frequency, _PERIOD_FORMATS["monthly"])
     selected: list[WaybackSnapshot] = []
 
-    for period_snapshots in grouped.values():
-        if len(period_snapshots) == 1:
-            selected.append(period_snapshots[0])
-        else:
-            mid_index = len(period_snapshots) // 2
-            selected.append(period_snapshots[mid_index])
+    # Sorted input means each period is one contiguous run; emit the middle
+    # of a run as soon as the key changes instead of grouping everything first
+    run_start = 0
+    run_key = snapshots[0].datetime.strftime(period_format)
+    for index in range(1, len(snapshots)):
+        key = snapshots[index].datetime.strftime(period_format)
+        if key != run_key:
+            selected.append(snapshots[(run_start + index) // 2])
+            run_start = index
+            run_key = key
+    selected.append(snapshots[(run_start + len(snapshots)) // 2])
 
-    return sorted(selected, key=lambda s: s.datetime)
+    return selected
 
 
 async def fetch_snapshot_html(
@@ -205,3 +216,32 @@ async def fetch_snapshot_html(
         return (snapshot, None, f"HTTP {exc.response.status_code}")
     except httpx.RequestError as exc:
         return (snapshot, None, str(exc))
+
+
+async def fetch_snapshots_html(
+    snapshots: list[WaybackSnapshot],
+    client: httpx.AsyncClient,
+    concurrency: int = 8,
+) -> list[tuple[WaybackSnapshot, str | None, str | None]]:
+    """Fetch the HTML for many snapshots concurrently.
+
+    Wayback fetches are latency-bound, so requests run in parallel with at
+    most `concurrency` in flight at once.
+
+    Args:
+        snapshots: The WaybackSnapshots to fetch.
+        client: An httpx async client for making requests. Its connection
+                limit should be at least `concurrency` to reuse connections.
+        concurrency: Maximum number of simultaneous requests.
+
+    Returns:
+        A list of (snapshot, html_content, error_message) tuples in the same
+        order as `snapshots`, as returned by fetch_snapshot_html.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch_one(snapshot: WaybackSnapshot) -> tuple[WaybackSnapshot, str | None, str | None]:
+        async with semaphore:
+            return await fetch_snapshot_html(snapshot, client)
+
+    return await asyncio.gather(*(fetch_one(s) for s in snapshots))